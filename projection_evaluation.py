@@ -1,53 +1,159 @@
+import hashlib
 import json
+import math
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import zlib
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from datetime import datetime, UTC
 
+from utils.innings import convert_ip_to_decimal
+
 YEARS: List[int] = list(range(2010, 2025))
 
-BATTING_VOLUME_STATS: List[str] = ["PA"]
-BATTING_RATE_STATS: List[str] = [
-    "wOBA",
-    "SO/PA",
-    "BB/PA",
-    "HBP/PA",
-    "HR/BIP",
-    "BABIP",
-    "1B/(BIP-HR)",
-    "2B/(BIP-HR)",
-    "3B/(BIP-HR)",
-    "R/PA",
-    "RBI/PA",
-    "SB/TOF",
-    "AVG",
-    "OBP",
-    "SLG",
-]
+@dataclass(frozen=True)
+class StatDefinition:
+    """Declarative definition of a stat as numerator / denominator expressions.
+
+    Expressions are sums of optionally scaled columns, e.g. "1B + 2*2B + 3*3B + 4*HR".
+    A column suffixed with "?" is treated as 0 when missing. Stats without a
+    numerator or compute function are read straight from the source data.
+    """
+
+    name: str
+    kind: str  # "volume", "counting" or "rate"
+    numerator: Optional[str] = None
+    denominator: Optional[str] = None
+    requires: Tuple[str, ...] = ()
+    compute: Optional[Callable[[pd.DataFrame, Optional[int], str], Optional[pd.Series]]] = None
+
+    @property
+    def is_derived(self) -> bool:
+        return self.numerator is not None or self.compute is not None
+
+    @property
+    def dependencies(self) -> Tuple[str, ...]:
+        columns = []
+        for expression in (self.numerator, self.denominator):
+            if expression is not None:
+                columns.extend(
+                    column
+                    for _, _, column, optional in _parse_expression(expression)
+                    if not optional
+                )
+        return tuple(dict.fromkeys(columns + list(self.requires)))
+
+
+def _woba_stat(df: pd.DataFrame, year: Optional[int], player_type: str) -> Optional[pd.Series]:
+    """wOBA needs the season's linear weights, so it is only computed when a year is known"""
+    if year is None:
+        return None
+    return calculate_woba(df, year, player_type)
 
-PITCHING_VOLUME_STATS: List[str] = ["BF"]
-PITCHING_RATE_STATS: List[str] = [
-    "wOBA",
-    "SO/BF",
-    "BB/BF",
-    "HBP/BF",
-    "HR/BIP",
-    "BABIP",
-    "1B/(BIP-HR)",
-    "2B/(BIP-HR)",
-    "3B/(BIP-HR)",
-    "R/BF",
-    "ER/BF",
-    "W/G",
-    "L/G",
-    "SV/G",
-    "HLD/G",
-    "ERA",
-    "WHIP",
+
+# Rates on balls in play are defined the same way for hitters and pitchers
+_BALL_IN_PLAY_RATES: List[StatDefinition] = [
+    StatDefinition("HR/BIP", "rate", "HR", "BIP"),
+    StatDefinition("BABIP", "rate", "H - HR", "BIP - HR"),
+    StatDefinition("1B/(BIP-HR)", "rate", "1B", "BIP - HR"),
+    StatDefinition("2B/(BIP-HR)", "rate", "2B", "BIP - HR"),
+    StatDefinition("3B/(BIP-HR)", "rate", "3B", "BIP - HR"),
 ]
 
+STAT_DEFINITIONS: Dict[str, Dict[str, StatDefinition]] = {
+    player_type: {definition.name: definition for definition in definitions}
+    for player_type, definitions in {
+        "batting": [
+            StatDefinition("PA", "volume"),
+            StatDefinition("AB", "counting"),
+            StatDefinition("H", "counting"),
+            StatDefinition("1B", "counting", "H - 2B - 3B - HR"),
+            StatDefinition("2B", "counting"),
+            StatDefinition("3B", "counting"),
+            StatDefinition("HR", "counting"),
+            StatDefinition("BB", "counting"),
+            StatDefinition("SO", "counting"),
+            StatDefinition("HBP", "counting"),
+            StatDefinition("R", "counting"),
+            StatDefinition("RBI", "counting"),
+            StatDefinition("SB", "counting"),
+            StatDefinition("BIP", "counting", "PA - SO - BB - HBP"),
+            # Times on first base only matter as the SB/TOF denominator
+            StatDefinition("TOF", "counting", "BB + HBP + H - 2B - 3B - HR", requires=("SB",)),
+            StatDefinition("wOBA", "rate", requires=("PA", "1B"), compute=_woba_stat),
+            StatDefinition("SO/PA", "rate", "SO", "PA"),
+            StatDefinition("BB/PA", "rate", "BB", "PA"),
+            StatDefinition("HBP/PA", "rate", "HBP", "PA"),
+            *_BALL_IN_PLAY_RATES,
+            StatDefinition("R/PA", "rate", "R", "PA"),
+            StatDefinition("RBI/PA", "rate", "RBI", "PA"),
+            StatDefinition("SB/TOF", "rate", "SB", "TOF"),
+            StatDefinition("AVG", "rate", "H", "AB"),
+            StatDefinition("OBP", "rate", "H + BB + HBP", "AB + BB + HBP + SF?"),
+            StatDefinition("SLG", "rate", "1B + 2*2B + 3*3B + 4*HR", "AB"),
+        ],
+        "pitching": [
+            StatDefinition("BF", "volume"),
+            StatDefinition("IP", "counting"),
+            StatDefinition("H", "counting"),
+            StatDefinition("1B", "counting", "H - 2B - 3B - HR"),
+            StatDefinition("2B", "counting"),
+            StatDefinition("3B", "counting"),
+            StatDefinition("HR", "counting"),
+            StatDefinition("BB", "counting"),
+            StatDefinition("SO", "counting"),
+            StatDefinition("HBP", "counting"),
+            StatDefinition("ER", "counting"),
+            StatDefinition("R", "counting"),
+            StatDefinition("W", "counting"),
+            StatDefinition("L", "counting"),
+            StatDefinition("SV", "counting"),
+            StatDefinition("HLD", "counting"),
+            StatDefinition("G", "counting"),
+            StatDefinition("BIP", "counting", "BF - SO - BB - HBP"),
+            StatDefinition("wOBA", "rate", requires=("BF", "1B"), compute=_woba_stat),
+            StatDefinition("SO/BF", "rate", "SO", "BF"),
+            StatDefinition("BB/BF", "rate", "BB", "BF"),
+            StatDefinition("HBP/BF", "rate", "HBP", "BF"),
+            *_BALL_IN_PLAY_RATES,
+            StatDefinition("R/BF", "rate", "R", "BF"),
+            StatDefinition("ER/BF", "rate", "ER", "BF"),
+            StatDefinition("W/G", "rate", "W", "G"),
+            StatDefinition("L/G", "rate", "L", "G"),
+            StatDefinition("SV/G", "rate", "SV", "G"),
+            StatDefinition("HLD/G", "rate", "HLD", "G"),
+            StatDefinition("ERA", "rate", "9*ER", "IP"),
+            StatDefinition("WHIP", "rate", "BB + H", "IP"),
+        ],
+    }.items()
+}
+
+
+def stat_names(player_type: str, kinds: Optional[Sequence[str]] = None) -> List[str]:
+    """Names of the registered stats for a player type, optionally filtered by kind"""
+    return [
+        name
+        for name, definition in STAT_DEFINITIONS[player_type].items()
+        if kinds is None or definition.kind in kinds
+    ]
+
+
+BATTING_VOLUME_STATS: List[str] = stat_names("batting", ["volume"])
+BATTING_RATE_STATS: List[str] = stat_names("batting", ["rate"])
+
+PITCHING_VOLUME_STATS: List[str] = stat_names("pitching", ["volume"])
+PITCHING_RATE_STATS: List[str] = stat_names("pitching", ["rate"])
+
 PROJECTION_SYSTEMS: List[str] = ["Marcel", "Steamer", "ZiPS", "Razzball", "Davenport"]
 PLAYER_TYPES: List[str] = ["batting", "pitching"]
 
@@ -55,28 +161,121 @@ STATS_DIR: str = "stats"
 PROJECTIONS_DIR: str = "projections"
 OUTPUT_DIR: str = "src/_data"
 
+# Number of loaded actual stats files kept in memory during a run
+ACTUAL_STATS_CACHE_SIZE: int = 4
+
+# Normalized copies of the source CSVs are cached here as Parquet (requires pyarrow)
+CACHE_DIR: str = ".cache"
+USE_NORMALIZED_CACHE: bool = True
+# Bump whenever the normalization steps change so stale cache files are ignored
+NORMALIZATION_VERSION: int = 3
+
+# Number of biggest misses reported per stat, with optional per-stat overrides
+BIGGEST_MISSES_COUNT: int = 10
+BIGGEST_MISSES_BY_STAT: Dict[str, int] = {}
+
+# Loaded frames are stored compactly: names as categoricals and whole-number
+# counting stats as nullable Int32. FLOAT32_RATE_STATS also stores rate stats as
+# float32 (written out rounded to their shortest decimal form). Metrics are
+# still computed in float64. On 2021-2023 data, MAE, RMSE and R^2 came within
+# 3e-5 (relative) of a float64 run and bias, which sits near zero, within 3e-8
+# (absolute); tests hold a fixture to FLOAT32_RATE_TOLERANCE. Near-tied biggest
+# misses can swap places.
+#
+# On 2021-2023 stats and projections the merged frames are ~7% smaller with
+# COMPACT_DTYPES and ~22% smaller with FLOAT32_RATE_STATS as well, well short
+# of halving memory: most columns are already dense float64 stats.
+COMPACT_DTYPES: bool = True
+FLOAT32_RATE_STATS: bool = False
+FLOAT32_RATE_TOLERANCE: float = 1e-4
+
+# Incremental runs keep each combination's results and player rows under
+# CACHE_DIR and only re-evaluate combinations whose input files changed
+INCREMENTAL: bool = False
+# Bump whenever the evaluation logic changes so incremental runs start over
+EVALUATION_VERSION: int = 1
+
+# Output JSON is compact unless JSON_PRETTY; JSON_FLOAT_PRECISION rounds floats
+# to that many decimal places to shrink the files (None keeps full precision)
+JSON_PRETTY: bool = False
+JSON_FLOAT_PRECISION: Optional[int] = None
+
+# Streaming mode spills player rows to disk as combinations finish and writes
+# player chunks one at a time, so memory no longer grows with the years covered
+STREAM_PLAYER_CHUNKS: bool = False
+# Leading playerId characters that pick a spill partition; prefixes sort in ID order
+SPILL_PREFIX_LENGTH: int = 2
+PLAYER_CHUNK_SIZE: int = 100
+# Version 2 manifests point at chunk files that are objects keyed by player ID
+# (version 1 chunks, without a manifest version, are lists of players)
+PLAYER_MANIFEST_VERSION: int = 2
+# "sequential" slices the ID-sorted players into PLAYER_CHUNK_SIZE blocks; "hash"
+# puts each player in one of PLAYER_BUCKETS chunks by a stable hash of their ID,
+# so adding players only changes the buckets they land in
+PLAYER_CHUNKING: str = "sequential"
+PLAYER_BUCKETS: int = 64
+
+# Wide mode evaluates each year against one table holding the actual stats once
+# and a projected block per system, instead of one actual/projection merge per system
+WIDE_EVALUATION: bool = False
+
+# Worker processes for the evaluation grid; None uses every CPU, 1 runs serially
+MAX_WORKERS: Optional[int] = None
+
+ACTUAL_ID_COLUMNS: List[str] = ["playerId", "playerName"]
+PROJECTION_ID_COLUMNS: List[str] = ["xMLBAMID"]
+
 # Load wOBA constants
-WOBA_CONSTANTS = pd.read_csv(Path(STATS_DIR) / "woba.csv")
-WOBA_CONSTANTS.set_index("Season", inplace=True)
+WOBA_WEIGHT_COLUMNS: List[str] = ["wBB", "wHBP", "w1B", "w2B", "w3B", "wHR"]
+
 
-def _convert_ip_to_decimal(ip: float) -> float:
-    """Converts IP from fractional (e.g., 1.1, 1.2) to decimal (e.g., 1.33, 1.67)"""
-    integer_part = int(ip)
-    fractional_part = round(ip - integer_part, 1)
-    if fractional_part == 0.1:
-        return integer_part + (1 / 3)
-    elif fractional_part == 0.2:
-        return integer_part + (2 / 3)
-    return float(ip)
+def load_woba_constants() -> pd.DataFrame:
+    """wOBA linear weights by season from STATS_DIR/woba.csv, read on first use
 
+    The table is cached by the file's resolved path and modification time, so
+    pointing STATS_DIR elsewhere or editing the file is picked up. A missing
+    file gives an empty table, so wOBA is simply not evaluated.
+    """
+    file_path = (Path(STATS_DIR) / "woba.csv").resolve()
+    mtime_ns = file_path.stat().st_mtime_ns if file_path.exists() else None
+    return _read_woba_constants(file_path, mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _read_woba_constants(file_path: Path, mtime_ns: Optional[int]) -> pd.DataFrame:
+    if mtime_ns is None:
+        print(f"Warning: {file_path} not found, wOBA will not be evaluated")
+        return pd.DataFrame(columns=WOBA_WEIGHT_COLUMNS, index=pd.Index([], name="Season"), dtype=float)
+    return pd.read_csv(file_path).set_index("Season")
+
+
+def woba_weights(seasons: Sequence[int]) -> pd.DataFrame:
+    """wOBA weights for each entry of seasons (one row per entry, NaN for unknown seasons)"""
+    return load_woba_constants().reindex(pd.Index(seasons, name="Season"))[WOBA_WEIGHT_COLUMNS]
 
 def calculate_woba(df: pd.DataFrame, year: int, player_type: str = "batting") -> pd.Series:
     """Calculate wOBA for a dataframe using the constants for a given year"""
-    if year not in WOBA_CONSTANTS.index:
+    constants = woba_weights([year]).iloc[0]
+    if constants.isna().any():
         return pd.Series(index=df.index)
+    return _woba(df, constants.to_numpy(), player_type)
+
 
-    constants = WOBA_CONSTANTS.loc[year]
+def calculate_woba_by_season(
+    df: pd.DataFrame, player_type: str = "batting", season_column: str = "season"
+) -> pd.Series:
+    """Calculate wOBA for a frame spanning many seasons in one pass
 
+    Each row gets the linear weights of its season_column value; rows from
+    seasons without constants get NaN.
+    """
+    weights = woba_weights(df[season_column].to_numpy()).to_numpy()
+    result = _woba(df, weights, player_type)
+    return result.where(~np.isnan(weights).any(axis=1))
+
+
+def _woba(df: pd.DataFrame, weights: np.ndarray, player_type: str) -> pd.Series:
+    """wOBA from linear weights in WOBA_WEIGHT_COLUMNS order, either one set or one row per df row"""
     # Fill missing values with 0
     for stat in ["BB", "HBP", "1B", "2B", "3B", "HR"]:
         if stat not in df.columns:
@@ -86,12 +285,12 @@ def calculate_woba(df: pd.DataFrame, year: int, player_type: str = "batting") ->
 
     # Calculate wOBA
     woba = (
-        constants.wBB * df["BB"] +
-        constants.wHBP * df["HBP"] +
-        constants.w1B * df["1B"] +
-        constants.w2B * df["2B"] +
-        constants.w3B * df["3B"] +
-        constants.wHR * df["HR"]
+        weights[..., 0] * df["BB"] +
+        weights[..., 1] * df["HBP"] +
+        weights[..., 2] * df["1B"] +
+        weights[..., 3] * df["2B"] +
+        weights[..., 4] * df["3B"] +
+        weights[..., 5] * df["HR"]
     )
 
     # Get plate appearances/batters faced
@@ -123,110 +322,198 @@ def calculate_woba(df: pd.DataFrame, year: int, player_type: str = "batting") ->
     result = result.replace([np.inf, -np.inf], np.nan)
     return result.fillna(0)
 
-def calculate_rate_stats(df: pd.DataFrame, player_type: str, year: Optional[int] = None) -> pd.DataFrame:
-    """Calculate all rate stats for a dataframe"""
+def _safe_divide(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    """Element-wise numerator / denominator, returning 0 wherever the denominator is 0"""
+    num = np.asarray(numerator, dtype=float)
+    den = np.asarray(denominator, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den == 0, 0.0, num / den)
+
+
+@lru_cache(maxsize=None)
+def _parse_expression(expression: str) -> Tuple[Tuple[str, float, str, bool], ...]:
+    """Parse "H + 2*2B - SF?" into (sign, coefficient, column, optional) terms"""
+    tokens = expression.split()
+    terms = []
+    for i in range(0, len(tokens), 2):
+        sign = "+" if i == 0 else tokens[i - 1]
+        if sign not in ("+", "-"):
+            raise ValueError(f"Invalid operator {sign!r} in stat expression {expression!r}")
+        coefficient, _, column = tokens[i].rpartition("*")
+        optional = column.endswith("?")
+        terms.append(
+            (
+                sign,
+                (int(coefficient) if coefficient.isdigit() else float(coefficient)) if coefficient else 1,
+                column.rstrip("?"),
+                optional,
+            )
+        )
+    return tuple(terms)
+
+
+def _evaluate_expression(df: pd.DataFrame, expression: str) -> pd.Series:
+    """Evaluate a stat expression column-wise, term by term from left to right"""
+    result = None
+    for sign, coefficient, column, optional in _parse_expression(expression):
+        value = df[column] if column in df.columns or not optional else 0
+        if coefficient != 1:
+            value = coefficient * value
+        if result is None:
+            result = value if sign == "+" else -value
+        elif sign == "+":
+            result = result + value
+        else:
+            result = result - value
+    return result
+
+
+@lru_cache(maxsize=None)
+def compile_stat_plan(player_type: str, stats: Optional[Tuple[str, ...]] = None) -> Tuple[StatDefinition, ...]:
+    """Order the derived stats needed for the requested stats so every stat follows its prerequisites"""
+    definitions = STAT_DEFINITIONS[player_type]
+    requested = tuple(definitions) if stats is None else stats
+    plan: List[StatDefinition] = []
+    visiting = set()
+    visited = set()
+
+    def visit(name: str) -> None:
+        if name in visited or name not in definitions:
+            return
+        if name in visiting:
+            raise ValueError(f"Circular stat definition involving {name!r}")
+        visiting.add(name)
+        definition = definitions[name]
+        for dependency in definition.dependencies:
+            visit(dependency)
+        visiting.discard(name)
+        visited.add(name)
+        if definition.is_derived:
+            plan.append(definition)
+
+    for name in requested:
+        if name not in definitions:
+            raise KeyError(f"Unknown {player_type} stat: {name!r}")
+        visit(name)
+    return tuple(plan)
+
+
+# Source columns read while preparing counting stats and by calculate_woba,
+# beyond those referenced by the stat expressions themselves
+_PREPARATION_COLUMNS: Dict[str, List[str]] = {
+    "batting": ["PA", "AB", "BB", "HBP", "SF", "SH", "SB", "H", "2B", "3B", "HR"],
+    "pitching": ["BF", "TBF", "IP", "H", "BB", "HBP", "SO", "K", "R", "RA", "ER", "ERA", "2B", "3B", "HR"],
+}
+
+
+def _source_columns(
+    player_type: str, stats: Optional[Sequence[str]], id_columns: Sequence[str]
+) -> List[str]:
+    """Columns a loader needs from the source data to derive the requested stats"""
+    plan = compile_stat_plan(player_type, None if stats is None else tuple(stats))
+    requested = stat_names(player_type) if stats is None else list(stats)
+    columns = list(id_columns) + requested + _PREPARATION_COLUMNS[player_type]
+    for definition in plan:
+        columns.extend(definition.dependencies)
+        for expression in (definition.numerator, definition.denominator):
+            if expression is not None:
+                columns.extend(column for _, _, column, _ in _parse_expression(expression))
+    return list(dict.fromkeys(columns))
+
+
+# Source columns read as text; every other column a loader reads is numeric
+_TEXT_COLUMNS = {"playerId", "playerName", "position", "xMLBAMID", "player_id", "MLBID"}
+
+# Extra source columns the normalization steps use (position filter, raw ID columns)
+_NORMALIZATION_COLUMNS: Dict[str, List[str]] = {
+    "actual": ["position"],
+    "projections": ["player_id", "MLBID"],
+}
+
+
+def _source_dtypes(player_type: str, source: str) -> Dict[str, Any]:
+    """Columns (with dtypes) to read from an "actual" or "projections" CSV
+
+    This is everything any registered stat can need, so one normalized copy
+    serves every stats subset.
+    """
+    id_columns = ACTUAL_ID_COLUMNS if source == "actual" else PROJECTION_ID_COLUMNS
+    columns = _source_columns(player_type, None, id_columns) + _NORMALIZATION_COLUMNS[source]
+    return {column: str if column in _TEXT_COLUMNS else "float64" for column in columns}
+
+
+def _float32_rates(float32_rates: Optional[bool] = None) -> bool:
+    """Whether rate stats are stored as float32 (FLOAT32_RATE_STATS unless overridden)"""
+    if float32_rates is None:
+        float32_rates = FLOAT32_RATE_STATS
+    return COMPACT_DTYPES and float32_rates
+
+
+def apply_dtype_policy(
+    df: pd.DataFrame, player_type: str, float32_rates: Optional[bool] = None
+) -> pd.DataFrame:
+    """Store a loaded frame compactly (see COMPACT_DTYPES and FLOAT32_RATE_STATS)
+
+    float32_rates overrides FLOAT32_RATE_STATS.
+    """
+    if not COMPACT_DTYPES or df.empty:
+        return df
+    float32_rates = _float32_rates(float32_rates)
+
+    rate_stats = set(stat_names(player_type, ["rate"]))
+    converted = {}
+    for column in df.columns:
+        values = df[column]
+        if column == "playerName":
+            converted[column] = values.astype("category")
+        elif column in _TEXT_COLUMNS:
+            # IDs stay strings (they are merge keys); share repeated Python string objects
+            if values.dtype == object:
+                converted[column] = values.map(sys.intern, na_action="ignore")
+        elif column in rate_stats:
+            if float32_rates and values.dtype == np.float64:
+                converted[column] = values.astype(np.float32)
+        elif values.dtype == np.float64:
+            finite = values.to_numpy()[~values.isna().to_numpy()]
+            if np.array_equal(finite, np.trunc(finite)) and (np.abs(finite) < 2**31).all():
+                converted[column] = values.astype("Int32")
+    return df.assign(**converted)
+
+
+def _prepare_counting_stats(df: pd.DataFrame, player_type: str) -> pd.DataFrame:
+    """Fill and backfill the counting stats that the stat definitions are built on"""
     # Fill missing values with 0 for required stats
-    required_cols = (
-        ["PA", "AB", "H", "BB", "SO", "HBP", "HR", "2B", "3B", "SF", "SH"]
+    fill_cols = (
+        ["PA", "AB", "H", "BB", "SO", "HBP", "HR", "2B", "3B", "SF", "SH", "SB"]
         if player_type == "batting"
-        else ["BF", "H", "BB", "SO", "HBP", "HR", "2B", "3B", "IP", "ER", "G"]
+        else ["BF", "H", "BB", "SO", "HBP", "HR", "2B", "3B", "IP", "ER", "G", "W", "L", "SV", "HLD"]
     )
 
+    # Handle K vs SO column naming for strikeouts
+    if player_type == "pitching" and "SO" not in df.columns and "K" in df.columns:
+        df["SO"] = df["K"]
+
     # Ensure HBP exists (create with 0 if missing)
     if "HBP" not in df.columns:
         df["HBP"] = 0
 
-    for col in required_cols:
+    for col in fill_cols:
         if col in df.columns:
             df[col] = df[col].fillna(0)
 
-    # Calculate singles
-    if all(col in df.columns for col in ["H", "2B", "3B", "HR"]):
-        df["1B"] = df["H"] - df["2B"] - df["3B"] - df["HR"]
-
     if player_type == "batting":
         # Calculate PA if missing
         if "PA" not in df.columns and all(col in df.columns for col in ["AB", "BB", "HBP", "SF", "SH"]):
             df["PA"] = df["AB"] + df["BB"] + df["HBP"] + df["SF"] + df["SH"]
-
-        if "PA" in df.columns:
-            # Basic rate stats
-            df["SO/PA"] = df.apply(lambda row: 0 if row["PA"] == 0 else row["SO"] / row["PA"], axis=1)
-            df["BB/PA"] = df.apply(lambda row: 0 if row["PA"] == 0 else row["BB"] / row["PA"], axis=1)
-            df["HBP/PA"] = df.apply(lambda row: 0 if row["PA"] == 0 else row["HBP"] / row["PA"], axis=1)
-
-            # Calculate BIP and related stats
-            df["BIP"] = df["PA"] - df["SO"] - df["BB"] - df["HBP"]
-            df["HR/BIP"] = df.apply(lambda row: 0 if row["BIP"] == 0 else row["HR"] / row["BIP"], axis=1)
-
-            # Traditional stats
-            df["AVG"] = df.apply(lambda row: 0 if row["AB"] == 0 else row["H"] / row["AB"], axis=1)
-            df["OBP"] = df.apply(
-                lambda row: 0
-                if (row["AB"] + row["BB"] + row["HBP"] + row.get("SF", 0)) == 0
-                else (row["H"] + row["BB"] + row["HBP"]) / (row["AB"] + row["BB"] + row["HBP"] + row.get("SF", 0)),
-                axis=1
-            )
-            df["SLG"] = df.apply(
-                lambda row: 0
-                if row["AB"] == 0
-                else (row["1B"] + 2*row["2B"] + 3*row["3B"] + 4*row["HR"]) / row["AB"],
-                axis=1
-            )
-
-            # Calculate wOBA if year is provided
-            if year is not None:
-                df["wOBA"] = calculate_woba(df, year, player_type)
-
-            # Additional rate stats
-            if "R" in df.columns:
-                df["R/PA"] = df.apply(lambda row: 0 if row["PA"] == 0 else row["R"] / row["PA"], axis=1)
-
-            if "RBI" in df.columns:
-                df["RBI/PA"] = df.apply(lambda row: 0 if row["PA"] == 0 else row["RBI"] / row["PA"], axis=1)
-
-            # Calculate BABIP and hit type rates
-            if all(col in df.columns for col in ["H", "2B", "3B", "HR"]):
-                df["BABIP"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else (row["H"] - row["HR"]) / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["1B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["1B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["2B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["2B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["3B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["3B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-
-            # Calculate SB/TOF if all required columns are available
-            if all(col in df.columns for col in ["SB", "BB", "HBP", "H", "2B", "3B", "HR"]):
-                df["SB"] = df["SB"].fillna(0)
-                df["TOF"] = df["BB"] + df["HBP"] + df["H"] - df["2B"] - df["3B"] - df["HR"]
-                df["SB/TOF"] = df.apply(lambda row: 0 if row["TOF"] == 0 else row["SB"] / row["TOF"], axis=1)
     else:  # pitching
-        # Handle K vs SO column naming for strikeouts
-        if "SO" not in df.columns and "K" in df.columns:
-            df["SO"] = df["K"]
-
-        # Calculate BF when missing or empty: IP*3 + H + BB + HBP
-        # First, ensure HBP exists (fill with 0 if missing)
-        if "HBP" not in df.columns:
-            df["HBP"] = 0
-
         # Calculate R and ER from RA and ERA if they're not available
         if "R" not in df.columns and "RA" in df.columns and "IP" in df.columns:
-            df["R"] = df.apply(lambda row: 0 if row["IP"] == 0 else (row["RA"] * row["IP"]) / 9, axis=1)
+            df["R"] = np.where(df["IP"] == 0, 0.0, (df["RA"] * df["IP"]) / 9)
 
         if "ER" not in df.columns and "ERA" in df.columns and "IP" in df.columns:
-            df["ER"] = df.apply(lambda row: 0 if row["IP"] == 0 else (row["ERA"] * row["IP"]) / 9, axis=1)
+            df["ER"] = np.where(df["IP"] == 0, 0.0, (df["ERA"] * df["IP"]) / 9)
 
-        required_cols = ["IP", "H", "BB", "HBP"]
+        # Calculate BF when missing or empty: IP*3 + H + BB + HBP
         should_calculate_bf = True
 
         # Check if BF or TBF exists and has valid data
@@ -236,77 +523,148 @@ def calculate_rate_stats(df: pd.DataFrame, player_type: str, year: Optional[int]
             df["BF"] = df["TBF"]
             should_calculate_bf = False
 
-        if should_calculate_bf and all(col in df.columns for col in required_cols):
+        if should_calculate_bf and all(col in df.columns for col in ["IP", "H", "BB", "HBP"]):
             df["BF"] = df["IP"] * 3 + df["H"] + df["BB"] + df["HBP"]
 
-        if "BF" in df.columns:
-            # Basic rate stats
-            df["SO/BF"] = df.apply(lambda row: 0 if row["BF"] == 0 else row["SO"] / row["BF"], axis=1)
-            df["BB/BF"] = df.apply(lambda row: 0 if row["BF"] == 0 else row["BB"] / row["BF"], axis=1)
-            df["HBP/BF"] = df.apply(lambda row: 0 if row["BF"] == 0 else row["HBP"] / row["BF"], axis=1)
-
-            # Calculate BIP and related stats
-            df["BIP"] = df["BF"] - df["SO"] - df["BB"] - df["HBP"]
-            df["HR/BIP"] = df.apply(lambda row: 0 if row["BIP"] == 0 else row["HR"] / row["BIP"], axis=1)
-
-            # Traditional stats
-            if "IP" in df.columns and "ER" in df.columns:
-                df["ERA"] = df.apply(lambda row: 0 if row["IP"] == 0 else (row["ER"] * 9) / row["IP"], axis=1)
-                df["WHIP"] = df.apply(lambda row: 0 if row["IP"] == 0 else (row["BB"] + row["H"]) / row["IP"], axis=1)
-
-            # Calculate wOBA if year is provided
-            if year is not None:
-                df["wOBA"] = calculate_woba(df, year, player_type)
-
-            # Additional rate stats
-            if "R" in df.columns:
-                df["R/BF"] = df.apply(lambda row: 0 if row["BF"] == 0 else row["R"] / row["BF"], axis=1)
-
-            if "ER" in df.columns:
-                df["ER/BF"] = df.apply(lambda row: 0 if row["BF"] == 0 else row["ER"] / row["BF"], axis=1)
-
-            # Calculate BABIP and hit type rates
-            if all(col in df.columns for col in ["H", "2B", "3B", "HR"]):
-                df["BABIP"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else (row["H"] - row["HR"]) / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["1B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["1B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["2B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["2B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
-                df["3B/(BIP-HR)"] = df.apply(
-                    lambda row: 0 if (row["BIP"] - row["HR"]) == 0 else row["3B"] / (row["BIP"] - row["HR"]),
-                    axis=1,
-                )
+    return df
 
-            # Calculate per-game stats if G column is available
-            if "G" in df.columns:
-                for stat in ["W", "L", "SV", "HLD"]:
-                    if stat in df.columns:
-                        df[stat] = df[stat].fillna(0)
-                        df[f"{stat}/G"] = df.apply(lambda row: 0 if row["G"] == 0 else row[stat] / row["G"], axis=1)
+
+def calculate_rate_stats(
+    df: pd.DataFrame,
+    player_type: str,
+    year: Optional[int] = None,
+    stats: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Calculate the requested stats (all registered stats by default) for a dataframe"""
+    df = _prepare_counting_stats(df, player_type)
+
+    plan = compile_stat_plan(player_type, None if stats is None else tuple(stats))
+    for definition in plan:
+        # Skip stats whose inputs this source doesn't provide
+        if not all(column in df.columns for column in definition.dependencies):
+            continue
+
+        if definition.compute is not None:
+            values = definition.compute(df, year, player_type)
+            if values is None:
+                continue
+        elif definition.denominator is None:
+            values = _evaluate_expression(df, definition.numerator)
+        else:
+            values = _safe_divide(
+                _evaluate_expression(df, definition.numerator),
+                _evaluate_expression(df, definition.denominator),
+            )
+        df[definition.name] = values
 
     return df
 
-def load_actual_stats(year: int, player_type: str) -> pd.DataFrame:
-    """Load actual stats for a given year and player type"""
-    suffix = "bat" if player_type == "batting" else "pit"
-    file_path = Path(STATS_DIR) / f"{year}_{suffix}.csv"
+def _file_digest(file_path: Path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-    if not file_path.exists():
-        print(f"Warning: {file_path} not found")
-        return pd.DataFrame()
 
-    df = pd.read_csv(file_path)
+@lru_cache(maxsize=None)
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("Note: pyarrow is not installed, so normalized stats will not be cached")
+        return False
+    return True
+
+
+def _select_columns(df: pd.DataFrame, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if columns is None:
+        return df
+    keep = set(columns)
+    return df.drop(columns=[c for c in df.columns if c not in keep])
+
+
+def _read_source_csv(file_path: Path, dtypes: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """Read a source CSV, parsing only the columns in dtypes (when given) with those dtypes"""
+    if dtypes is None:
+        return pd.read_csv(file_path)
+    try:
+        return pd.read_csv(file_path, usecols=lambda column: column in dtypes, dtype=dtypes)
+    except ValueError as e:
+        # A column that isn't cleanly numeric: fall back to letting pandas infer types
+        print(f"Warning: {file_path} does not match the expected column types ({e})")
+        return pd.read_csv(file_path, usecols=lambda column: column in dtypes)
+
+
+def _read_normalized(
+    file_path: Path,
+    normalize: Callable[[pd.DataFrame], pd.DataFrame],
+    columns: Optional[Sequence[str]] = None,
+    source_dtypes: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """Read a source CSV through its normalization step, using the on-disk Parquet cache when possible.
+
+    Only the source_dtypes columns are parsed from the CSV. Cache files are keyed
+    by a hash of the CSV contents, the source columns and their dtypes, and
+    NORMALIZATION_VERSION, so edited sources, newly evaluated stats or
+    normalization changes are picked up automatically. Only the requested
+    columns that exist in the source are returned.
+    """
+    if not (USE_NORMALIZED_CACHE and _parquet_available()):
+        df = normalize(_read_source_csv(file_path, source_dtypes))
+        return _select_columns(df, columns)
+
+    import pyarrow.parquet as pq
+
+    cache_dir = Path(CACHE_DIR) / "normalized"
+    prefix = f"{file_path.parent.name}_{file_path.stem}"
+    source_columns = None
+    if source_dtypes is not None:
+        source_columns = sorted((column, str(dtype)) for column, dtype in source_dtypes.items())
+    key = hashlib.sha256(
+        f"{_file_digest(file_path)}:{json.dumps(source_columns)}:{NORMALIZATION_VERSION}".encode()
+    ).hexdigest()[:20]
+    cache_path = cache_dir / f"{prefix}-{key}.parquet"
+
+    if cache_path.exists():
+        try:
+            cached_columns = columns
+            if columns is not None:
+                available = set(pq.read_schema(cache_path).names)
+                cached_columns = [c for c in columns if c in available]
+            return pd.read_parquet(cache_path, columns=cached_columns)
+        except Exception as e:
+            # A damaged entry (e.g. from an older interrupted write) is rebuilt from the CSV
+            print(f"Warning: discarding unreadable cache for {file_path}: {e}")
+            cache_path.unlink(missing_ok=True)
+
+    df = normalize(_read_source_csv(file_path, source_dtypes)).reset_index(drop=True)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{prefix}-*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        # Write to a temporary file first so an interrupted or concurrent
+        # write never leaves a partial file under the cache key
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: could not cache {file_path}: {e}")
+    return _select_columns(df, columns)
 
+
+def _actual_stats_path(year: int, player_type: str) -> Path:
+    suffix = "bat" if player_type == "batting" else "pit"
+    return Path(STATS_DIR) / f"{year}_{suffix}.csv"
+
+
+def _normalize_actual_stats(df: pd.DataFrame, player_type: str) -> pd.DataFrame:
+    """Put a raw stats file into the shape the evaluation expects"""
     # Convert IP for pitching stats from fractional to decimal
     if player_type == "pitching" and "IP" in df.columns:
-        df["IP"] = df["IP"].apply(_convert_ip_to_decimal)
+        df["IP"] = convert_ip_to_decimal(df["IP"], source=f"{player_type} IP")
 
     # Ensure playerId is string for consistent merging
     if "playerId" in df.columns:
@@ -321,55 +679,87 @@ def load_actual_stats(year: int, player_type: str) -> pd.DataFrame:
             # Only keep pitchers in pitching data
             df = df[df["position"] == "P"]
 
-    # Calculate all rate stats
-    df = calculate_rate_stats(df, player_type, year)
-
-    return df
+    return df.reset_index(drop=True)
 
-def load_projections(year: int, system: str, player_type: str) -> pd.DataFrame:
-    """Load projections for a given year, system, and player type"""
-    suffix = "bat" if player_type == "batting" else "pit"
 
-    file_path = Path(PROJECTIONS_DIR) / f"{system.lower()}_{year}_{suffix}.csv"
+def load_actual_stats(
+    year: int,
+    player_type: str,
+    stats: Optional[Sequence[str]] = None,
+    float32_rates: Optional[bool] = None,
+) -> pd.DataFrame:
+    """Load actual stats for a given year and player type, deriving the requested stats"""
+    file_path = _actual_stats_path(year, player_type)
 
     if not file_path.exists():
         print(f"Warning: {file_path} not found")
         return pd.DataFrame()
 
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return pd.DataFrame()
+    df = _read_normalized(
+        file_path,
+        lambda raw: _normalize_actual_stats(raw, player_type),
+        _source_columns(player_type, stats, ACTUAL_ID_COLUMNS),
+        _source_dtypes(player_type, "actual"),
+    )
+
+    # Calculate all rate stats
+    df = calculate_rate_stats(df, player_type, year, stats)
+
+    return apply_dtype_policy(df, player_type, float32_rates)
+
+class ActualStatsProvider:
+    """Per-run LRU cache of loaded actual stats, keyed by source file path and mtime.
+
+    Every projection system for a year is evaluated against the same actual
+    stats, so each stats file is read and derived once per run instead of once
+    per system. Each get() hands out its own copy, so callers are free to
+    modify it without changing the cached frame (pandas before 3.0 doesn't
+    enable copy-on-write, so a shallow copy would share the values).
+    """
+
+    def __init__(self, maxsize: int = ACTUAL_STATS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._frames: "OrderedDict[Tuple[str, int], pd.DataFrame]" = OrderedDict()
+
+    def get(self, year: int, player_type: str) -> pd.DataFrame:
+        file_path = _actual_stats_path(year, player_type)
+        if not file_path.exists():
+            return load_actual_stats(year, player_type)
+
+        key = (str(file_path), file_path.stat().st_mtime_ns)
+        df = self._frames.get(key)
+        if df is None:
+            df = load_actual_stats(year, player_type)
+            self._frames[key] = df
+            while len(self._frames) > self.maxsize:
+                self._frames.popitem(last=False)
+        else:
+            self._frames.move_to_end(key)
+        return df.copy()
+
+    def clear(self) -> None:
+        self._frames.clear()
 
-    # Fix xMLBAMID data type issues - convert float values to int to remove .0 decimals
+
+def _coerce_mlbam_ids(ids: pd.Series) -> pd.Series:
+    """Convert float values to int to remove .0 decimals, then to string"""
+    return pd.to_numeric(ids, errors="coerce").fillna(0).astype(int).astype(str)
+
+
+def _normalize_projections(df: pd.DataFrame, system: str, player_type: str) -> pd.DataFrame:
+    """Put a raw projections file into the shape the evaluation expects"""
+    # Fix xMLBAMID data type issues
     if "xMLBAMID" in df.columns:
-        # Convert to numeric, then to int to remove .0 decimals, then to string
-        df["xMLBAMID"] = (
-            pd.to_numeric(df["xMLBAMID"], errors="coerce")
-            .fillna(0)
-            .astype(int)
-            .astype(str)
-        )
+        df["xMLBAMID"] = _coerce_mlbam_ids(df["xMLBAMID"])
 
     # Marcel projections use 'player_id' for the MLBAM ID
     if system.lower() == "marcel" and "player_id" in df.columns:
         df = df.rename(columns={"player_id": "xMLBAMID"})
-        df["xMLBAMID"] = (
-            pd.to_numeric(df["xMLBAMID"], errors="coerce")
-            .fillna(0)
-            .astype(int)
-            .astype(str)
-        )
+        df["xMLBAMID"] = _coerce_mlbam_ids(df["xMLBAMID"])
 
     if "MLBID" in df.columns:
         df = df.rename(columns={"MLBID": "xMLBAMID"})
-        df["xMLBAMID"] = (
-            pd.to_numeric(df["xMLBAMID"], errors="coerce")
-            .fillna(0)
-            .astype(int)
-            .astype(str)
-        )
+        df["xMLBAMID"] = _coerce_mlbam_ids(df["xMLBAMID"])
 
     # Handle missing columns for Davenport projections
     if system.lower() == "davenport":
@@ -389,10 +779,44 @@ def load_projections(year: int, system: str, player_type: str) -> pd.DataFrame:
             if "HBP" not in df.columns:
                 df["HBP"] = 0
 
+    return df
+
+
+def _projection_path(year: int, system: str, player_type: str) -> Path:
+    suffix = "bat" if player_type == "batting" else "pit"
+    return Path(PROJECTIONS_DIR) / f"{system.lower()}_{year}_{suffix}.csv"
+
+
+def load_projections(
+    year: int,
+    system: str,
+    player_type: str,
+    stats: Optional[Sequence[str]] = None,
+    float32_rates: Optional[bool] = None,
+) -> pd.DataFrame:
+    """Load projections for a given year, system, and player type, deriving the requested stats"""
+    file_path = _projection_path(year, system, player_type)
+
+    if not file_path.exists():
+        print(f"Warning: {file_path} not found")
+        return pd.DataFrame()
+
+    try:
+        df = _read_normalized(
+            file_path,
+            lambda raw: _normalize_projections(raw, system, player_type),
+            _source_columns(player_type, stats, PROJECTION_ID_COLUMNS),
+            _source_dtypes(player_type, "projections"),
+        )
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return pd.DataFrame()
+
     # Calculate all rate stats
-    df = calculate_rate_stats(df, player_type, year)
+    df = calculate_rate_stats(df, player_type, year, stats)
+
+    return apply_dtype_policy(df, player_type, float32_rates)
 
-    return df
 
 @dataclass
 class ProjectionResult:
@@ -421,67 +845,146 @@ class ProjectionResult:
     biggest_misses: List[Dict]
 
 
-def calculate_metrics(
+def _row_metrics(
     actual: np.ndarray, projected: np.ndarray, weights: Optional[np.ndarray] = None
-) -> Dict[str, float]:
-    """Calculate basic metrics (RMSE, MAE, bias, R²)"""
-    if len(actual) == 0 or len(projected) == 0:
-        return {"rmse": np.nan, "mae": np.nan, "bias": np.nan, "r_squared": np.nan}
+) -> Dict[str, np.ndarray]:
+    """RMSE, MAE, bias and R² for each row of (stats x players) matrices without missing values.
 
+    Every reduction runs along contiguous rows, so each row gets exactly the
+    result it would get as a single-row matrix.
+    """
     errors = projected - actual
+    squared_errors = errors**2
 
-    # np.average correctly handles unweighted (weights=None) and weighted calculations
-    mae = np.average(np.abs(errors), weights=weights)
-    rmse = np.sqrt(np.average(errors**2, weights=weights))
-    bias = np.average(errors, weights=weights)
-
-    # R-squared calculation needs to be aware of weights
     if weights is not None:
-        ss_res = np.sum(weights * (errors**2))
-        weighted_actual_mean = np.average(actual, weights=weights)
-        ss_tot = np.sum(weights * ((actual - weighted_actual_mean) ** 2))
+        total_weight = weights.sum()
+        mae = np.multiply(np.abs(errors), weights).sum(axis=1) / total_weight
+        rmse = np.sqrt(np.multiply(squared_errors, weights).sum(axis=1) / total_weight)
+        bias = np.multiply(errors, weights).sum(axis=1) / total_weight
+
+        ss_res = (weights * squared_errors).sum(axis=1)
+        weighted_actual_mean = np.multiply(actual, weights).sum(axis=1) / total_weight
+        ss_tot = (weights * ((actual - weighted_actual_mean[:, None]) ** 2)).sum(axis=1)
     else:
-        ss_res = np.sum(errors**2)
-        ss_tot = np.sum((actual - np.mean(actual)) ** 2)
+        mae = np.abs(errors).mean(axis=1)
+        rmse = np.sqrt(squared_errors.mean(axis=1))
+        bias = errors.mean(axis=1)
+
+        ss_res = squared_errors.sum(axis=1)
+        ss_tot = ((actual - actual.mean(axis=1)[:, None]) ** 2).sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_tot > 0, 1 - (ss_res / ss_tot), 0.0)
+
+    return {"rmse": rmse, "mae": mae, "bias": bias, "r_squared": np.maximum(0, r_squared)}
+
+
+def calculate_metrics_batch(
+    actual: np.ndarray,
+    projected: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    actual_offsets: Optional[np.ndarray] = None,
+    projected_offsets: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """Calculate metrics for many stats at once.
+
+    actual and projected are (players x stats) matrices where NaN marks a
+    missing value; each stat is evaluated over the players with both values.
+    Returns arrays of raw rmse/mae/bias/r_squared per stat, plus la_ and wla_
+    (weighted) variants when league average offsets are given.
+    """
+    n_stats = actual.shape[1]
+    names = ["rmse", "mae", "bias", "r_squared"]
+    variants = [""]
+    if actual_offsets is not None and projected_offsets is not None:
+        variants.append("la_")
+        if weights is not None:
+            variants.append("wla_")
+    metrics = {
+        f"{variant}{name}": np.full(n_stats, np.nan) for variant in variants for name in names
+    }
+    metrics["n_players"] = np.zeros(n_stats, dtype=int)
+
+    # Stats with the same missing-value pattern are evaluated together
+    mask = ~(np.isnan(actual) | np.isnan(projected))
+    patterns, group_of_stat = np.unique(mask.T, axis=0, return_inverse=True)
+    for group, rows in enumerate(patterns):
+        stats = np.flatnonzero(group_of_stat.ravel() == group)
+        n_players = int(rows.sum())
+        metrics["n_players"][stats] = n_players
+        if n_players == 0:
+            continue
 
-    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        actual_rows = np.ascontiguousarray(actual[rows][:, stats].T)
+        projected_rows = np.ascontiguousarray(projected[rows][:, stats].T)
+        computed = {"": _row_metrics(actual_rows, projected_rows)}
+
+        if "la_" in variants:
+            actual_la = actual_rows - actual_offsets[stats][:, None]
+            projected_la = projected_rows - projected_offsets[stats][:, None]
+            computed["la_"] = _row_metrics(actual_la, projected_la)
+            if "wla_" in variants:
+                computed["wla_"] = _row_metrics(actual_la, projected_la, weights[rows])
+
+        for variant, values in computed.items():
+            for name in names:
+                metrics[f"{variant}{name}"][stats] = values[name]
+
+    return metrics
+
+
+def _top_k_positions(errors: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest errors, largest first.
+
+    Matches Series.nlargest: ties keep the earlier position first, and NaN
+    errors only fill the remaining slots when there are fewer than k others.
+    """
+    is_nan = np.isnan(errors)
+    valid = np.flatnonzero(~is_nan)
+    if k <= 0:
+        return valid[:0]
+    if k >= valid.size:
+        return np.concatenate(
+            [
+                valid[np.lexsort((valid, -errors[valid]))],
+                np.flatnonzero(is_nan)[: k - valid.size],
+            ]
+        )
 
-    return {"rmse": rmse, "mae": mae, "bias": bias, "r_squared": max(0, r_squared)}
+    values = errors[valid]
+    threshold = values[np.argpartition(-values, k - 1)[:k]].min()
+    above = valid[values > threshold]
+    ties = valid[values == threshold][: k - above.size]
+    top = np.concatenate([above, ties])
+    return top[np.lexsort((top, -errors[top]))]
 
 
 def find_biggest_misses(
     df: pd.DataFrame,
-    stat: str,
-    actual_col: str,
-    proj_col: str,
-    n_misses: int = 10,
-    error_col: Optional[str] = None,
+    positions: np.ndarray,
+    errors: np.ndarray,
+    actual: np.ndarray,
+    projected: np.ndarray,
+    n_misses: int = BIGGEST_MISSES_COUNT,
 ) -> List[Dict]:
-    """Find the biggest projection misses for a stat"""
-    if actual_col not in df.columns or proj_col not in df.columns:
-        return []
+    """Find the biggest projection misses for a stat
 
-    if error_col and error_col in df.columns:
-        # Use the pre-calculated error column if provided
-        errors = df[error_col]
-    else:
-        # Otherwise, calculate absolute error from actual and projected columns
-        errors = np.abs(df[proj_col] - df[actual_col])
-
-    # Handle cases where there are fewer players than n_misses
-    if len(errors) < n_misses:
-        n_misses = len(errors)
-
-    biggest_indices = errors.nlargest(n_misses).index
+    errors, actual and projected are aligned with positions, the row positions
+    in df they were taken from; only the winning rows of df are looked up.
+    """
+    top = _top_k_positions(errors, n_misses)
+    rows = positions[top]
+    names = df["playerName"].iloc[rows].tolist()
+    player_ids = df["playerId"].iloc[rows].tolist()
 
     misses = []
-    for idx in biggest_indices:
+    for i, name, player_id in zip(top, names, player_ids):
         miss_data = {
-            "player_name": df.loc[idx, "playerName"],
-            "actual": float(df.loc[idx, actual_col]),
-            "projected": float(df.loc[idx, proj_col]),
-            "error": float(errors.loc[idx]),
-            "player_id": df.loc[idx, "playerId"],
+            "player_name": name,
+            "actual": float(actual[i]),
+            "projected": float(projected[i]),
+            "error": float(errors[i]),
+            "player_id": player_id,
         }
         misses.append(miss_data)
     return misses
@@ -544,223 +1047,154 @@ def calculate_summary_stats(results: List[ProjectionResult]) -> Dict:
     return summary
 
 
-def generate_players_data_from_merged(merged_dataframes: Dict) -> List[Dict[str, Any]]:
-    """Generate player data using already-processed merged dataframes and split into chunks"""
-    print("Generating player data from merged dataframes...")
-
-    # Collect unique players
-    players_dict = {}
-    for (year, system, player_type), merged_df in merged_dataframes.items():
-        for _, row in merged_df.iterrows():
-            player_id = row["playerId"]
-            player_name = row.get("playerName", "Unknown")
-            if player_id not in players_dict:
-                players_dict[player_id] = {
-                    "id": player_id,
-                    "name": player_name,
-                    "years": {},
-                }
+def _as_float64(values: pd.Series) -> np.ndarray:
+    """values as float64, with float32 ones rounded to their shortest decimal form
 
-    # Process each player using the merged dataframes
-    for player_id, player_info in players_dict.items():
-        for year in YEARS:
-            year_data = {}
-
-            for player_type in PLAYER_TYPES:
-                type_data = {}
-                actual_stats = None
-
-                for system in PROJECTION_SYSTEMS:
-                    merged_df = merged_dataframes.get((year, system, player_type))
-                    if (
-                        merged_df is not None
-                        and player_id in merged_df["playerId"].values
-                    ):
-                        player_row = merged_df[merged_df["playerId"] == player_id].iloc[
-                            0
-                        ]
+    Without the rounding a stored float32 0.3 would come out as 0.30000001192...
+    """
+    if values.dtype == np.float32:
+        return values.to_numpy().astype(str).astype(np.float64)
+    return values.to_numpy(dtype=float, na_value=np.nan)
 
-                        # Set actual stats once per player_type/year
-                        if actual_stats is None:
-                            actual_stats = {}
-                            all_cols = (
-                                [
-                                    "PA",
-                                    "AB",
-                                    "H",
-                                    "1B",
-                                    "2B",
-                                    "3B",
-                                    "HR",
-                                    "BB",
-                                    "SO",
-                                    "HBP",
-                                    "R",
-                                    "RBI",
-                                    "SB",
-                                    "BIP",
-                                    "TOF",
-                                ]
-                                if player_type == "batting"
-                                else [
-                                    "BF",
-                                    "IP",
-                                    "H",
-                                    "1B",
-                                    "2B",
-                                    "3B",
-                                    "HR",
-                                    "BB",
-                                    "SO",
-                                    "HBP",
-                                    "ER",
-                                    "R",
-                                    "W",
-                                    "L",
-                                    "SV",
-                                    "HLD",
-                                    "G",
-                                    "BIP",
-                                ]
-                            )
-                            rate_stats = (
-                                BATTING_RATE_STATS
-                                if player_type == "batting"
-                                else PITCHING_RATE_STATS
-                            )
-                            all_stats = list(set(all_cols + rate_stats))
-
-                            # Raw actual stats
-                            for stat in all_stats:
-                                actual_col = (
-                                    f"{stat}_x" if f"{stat}_x" in player_row else stat
-                                )
-                                if actual_col in player_row:
-                                    val = player_row[actual_col]
-                                    actual_stats[stat] = None if pd.isna(val) else val
-
-                            # League-adjusted and weighted league-adjusted actual stats
-                            for stat in rate_stats:
-                                la_col = f"{stat}_actual_la"
-                                wla_col = f"{stat}_actual_wla"
-                                if la_col in player_row:
-                                    val = player_row[la_col]
-                                    actual_stats[f"{stat}_la"] = (
-                                        None if pd.isna(val) else val
-                                    )
-                                if wla_col in player_row:
-                                    val = player_row[wla_col]
-                                    actual_stats[f"{stat}_wla"] = (
-                                        None if pd.isna(val) else val
-                                    )
-
-                            type_data["Actual"] = actual_stats
-
-                        # Projection stats for this system
-                        proj_stats = {}
-                        all_cols = (
-                            [
-                                "PA",
-                                "AB",
-                                "H",
-                                "1B",
-                                "2B",
-                                "3B",
-                                "HR",
-                                "BB",
-                                "SO",
-                                "HBP",
-                                "R",
-                                "RBI",
-                                "SB",
-                                "BIP",
-                                "TOF",
-                            ]
-                            if player_type == "batting"
-                            else [
-                                "BF",
-                                "IP",
-                                "H",
-                                "1B",
-                                "2B",
-                                "3B",
-                                "HR",
-                                "BB",
-                                "SO",
-                                "HBP",
-                                "ER",
-                                "R",
-                                "W",
-                                "L",
-                                "SV",
-                                "HLD",
-                                "G",
-                                "BIP",
-                            ]
-                        )
-                        rate_stats = (
-                            BATTING_RATE_STATS
-                            if player_type == "batting"
-                            else PITCHING_RATE_STATS
-                        )
-                        all_stats = list(set(all_cols + rate_stats))
-
-                        # Raw projected stats
-                        for stat in all_stats:
-                            proj_col = f"{stat}_y"
-                            if proj_col in player_row:
-                                val = player_row[proj_col]
-                                proj_stats[stat] = None if pd.isna(val) else val
-
-                        # League-adjusted and weighted league-adjusted projected stats
-                        for stat in rate_stats:
-                            la_col = f"{stat}_proj_la"
-                            wla_col = f"{stat}_proj_wla"
-                            if la_col in player_row:
-                                val = player_row[la_col]
-                                proj_stats[f"{stat}_la"] = None if pd.isna(val) else val
-                            if wla_col in player_row:
-                                val = player_row[wla_col]
-                                proj_stats[f"{stat}_wla"] = (
-                                    None if pd.isna(val) else val
-                                )
-
-                        type_data[system] = proj_stats
-
-                if type_data:
-                    year_data[player_type] = type_data
-
-            if year_data:
-                player_info["years"][year] = year_data
-
-    # Determine primary type and filter out players with no data
-    players_list = []
-    for player_info in players_dict.values():
-        if player_info["years"]:
-            batting_years = sum(
-                1
-                for year_data in player_info["years"].values()
-                if "batting" in year_data
-            )
-            pitching_years = sum(
-                1
-                for year_data in player_info["years"].values()
-                if "pitching" in year_data
-            )
 
-            primary_type = "batting" if batting_years >= pitching_years else "pitching"
-            player_info["primary_type"] = primary_type
+def _float_matrix(df: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+    """One float64 column per entry of columns (see _as_float64)"""
+    if not columns:
+        return np.empty((len(df), 0))
+    return np.column_stack([_as_float64(df[column]) for column in columns])
+
+
+def _stat_records(df: pd.DataFrame, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Rows of df as {output key: value} dicts, with missing values as None"""
+    if not columns:
+        return [{} for _ in range(len(df))]
+    block = df[list(columns.values())]
+    block.columns = list(columns.keys())
+    float32_columns = {
+        column: _as_float64(values)
+        for column, values in block.items()
+        if values.dtype == np.float32
+    }
+    if float32_columns:
+        block = block.assign(**float32_columns)
+    return block.astype(object).where(block.notna(), None).to_dict("records")
+
+
+def _player_rows(year: int, system: str, player_type: str, merged_df: pd.DataFrame) -> pd.DataFrame:
+    """One row per player in a merged frame, holding its actual and projected stat payloads"""
+    # Like a per-player lookup, use the first row when a player appears more than once
+    merged_df = merged_df.drop_duplicates(subset="playerId", keep="first")
+    rate_stats = stat_names(player_type, ["rate"])
+    all_stats = stat_names(player_type)
+    columns = set(merged_df.columns)
+
+    # Actual stats carry the _x suffix only where the projection has the same column
+    actual_cols = {}
+    for stat in all_stats:
+        actual_col = f"{stat}_x" if f"{stat}_x" in columns else stat
+        if actual_col in columns:
+            actual_cols[stat] = actual_col
+    proj_cols = {stat: f"{stat}_y" for stat in all_stats if f"{stat}_y" in columns}
+
+    # League-adjusted and weighted league-adjusted stats
+    for stat in rate_stats:
+        for variant in ("la", "wla"):
+            if f"{stat}_actual_{variant}" in columns:
+                actual_cols[f"{stat}_{variant}"] = f"{stat}_actual_{variant}"
+            if f"{stat}_proj_{variant}" in columns:
+                proj_cols[f"{stat}_{variant}"] = f"{stat}_proj_{variant}"
+
+    return _rows_from_columns(
+        year, system, player_type, merged_df, merged_df, actual_cols, merged_df, proj_cols
+    )
+
+
+def _rows_from_columns(
+    year: int,
+    system: str,
+    player_type: str,
+    players: pd.DataFrame,
+    actual: pd.DataFrame,
+    actual_cols: Dict[str, str],
+    projected: pd.DataFrame,
+    proj_cols: Dict[str, str],
+) -> pd.DataFrame:
+    """Player rows from row-aligned frames, mapping output stat names to their source columns
+
+    players holds playerId (and playerName); it has already been deduplicated.
+    """
+    return pd.DataFrame(
+        {
+            "playerId": players["playerId"].to_numpy(),
+            "playerName": (
+                players["playerName"].to_numpy()
+                if "playerName" in players.columns
+                else "Unknown"
+            ),
+            "year": year,
+            "player_type": player_type,
+            "system": system,
+            "actual": _stat_records(actual, actual_cols),
+            "projected": _stat_records(projected, proj_cols),
+        }
+    )
+
+
+def build_players(rows: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Assemble per-player nested year/type/system data from a long table of player rows, sorted by ID"""
+    rows = rows.assign(
+        year_rank=rows["year"].map({year: i for i, year in enumerate(YEARS)}),
+        type_rank=rows["player_type"].map({t: i for i, t in enumerate(PLAYER_TYPES)}),
+        system_rank=rows["system"].map({s: i for i, s in enumerate(PROJECTION_SYSTEMS)}),
+    ).dropna(subset=["year_rank", "type_rank", "system_rank"])
+
+    # A player's name comes from the first row they appear in
+    names = rows.drop_duplicates(subset="playerId").set_index("playerId")["playerName"]
+
+    rows = rows.sort_values(
+        ["playerId", "year_rank", "type_rank", "system_rank"], kind="mergesort"
+    )
+
+    players_list = []
+    player_info = None
+    for player_id, year, player_type, system, actual, projected in zip(
+        rows["playerId"].tolist(),
+        rows["year"].tolist(),
+        rows["player_type"].tolist(),
+        rows["system"].tolist(),
+        rows["actual"].tolist(),
+        rows["projected"].tolist(),
+    ):
+        if player_info is None or player_info["id"] != player_id:
+            player_info = {"id": player_id, "name": names[player_id], "years": {}}
             players_list.append(player_info)
 
-    # Sort players by ID to ensure consistent chunking
-    players_list.sort(key=lambda x: x["id"])
+        type_data = player_info["years"].setdefault(year, {}).setdefault(player_type, {})
+        # Actual stats are the same for every system, so take them from the first
+        if "Actual" not in type_data:
+            type_data["Actual"] = actual
+        type_data[system] = projected
 
-    # Split players into chunks of approximately 100 players each
-    chunk_size = 100
+    # Determine primary type
+    for player_info in players_list:
+        batting_years = sum(
+            1 for year_data in player_info["years"].values() if "batting" in year_data
+        )
+        pitching_years = sum(
+            1 for year_data in player_info["years"].values() if "pitching" in year_data
+        )
+        player_info["primary_type"] = "batting" if batting_years >= pitching_years else "pitching"
+
+    return players_list
+
+
+def chunk_players(players_list: List[Dict[str, Any]], chunk_size: int = PLAYER_CHUNK_SIZE) -> Tuple[List[List[Dict]], Dict]:
+    """Split players (sorted by ID) into chunks and build the manifest of chunk assignments"""
     player_chunks = [players_list[i:i + chunk_size] for i in range(0, len(players_list), chunk_size)]
 
     # Create a manifest of all players and their chunk assignments
     player_manifest = {
+        "version": PLAYER_MANIFEST_VERSION,
         "total_players": len(players_list),
         "chunk_size": chunk_size,
         "total_chunks": len(player_chunks),
@@ -776,15 +1210,230 @@ def generate_players_data_from_merged(merged_dataframes: Dict) -> List[Dict[str,
 
     return player_chunks, player_manifest
 
-def save_player_chunks(player_chunks: List[List[Dict]], player_manifest: Dict, data_dir: Path) -> None:
-    """Save player data chunks and manifest to separate files"""
+
+def player_bucket(player_id: str, buckets: Optional[int] = None) -> int:
+    """Stable bucket for a player ID (CRC32, so it does not change between runs)"""
+    return zlib.crc32(str(player_id).encode()) % (buckets or PLAYER_BUCKETS)
+
+
+def bucket_players(players_list: List[Dict[str, Any]], buckets: Optional[int] = None) -> Tuple[List[List[Dict]], Dict]:
+    """Split players (sorted by ID) into hash buckets and build the manifest of bucket assignments"""
+    buckets = buckets or PLAYER_BUCKETS
+    player_chunks: List[List[Dict]] = [[] for _ in range(buckets)]
+    for player in players_list:
+        player_chunks[player_bucket(player["id"], buckets)].append(player)
+    return player_chunks, _bucket_manifest(player_chunks)
+
+
+def _bucket_manifest(player_chunks: List[List[Dict]]) -> Dict:
+    players = {
+        player["id"]: {
+            "name": player["name"],
+            "primary_type": player["primary_type"],
+            "chunk": bucket,
+        }
+        for bucket, chunk in enumerate(player_chunks)
+        for player in chunk
+    }
+    return {
+        "version": PLAYER_MANIFEST_VERSION,
+        "total_players": len(players),
+        "chunking": "hash",
+        "buckets": len(player_chunks),
+        "total_chunks": len(player_chunks),
+        # Players stay listed in ID order, as with sequential chunks
+        "players": dict(sorted(players.items())),
+    }
+
+
+def _split_players(players_list: List[Dict[str, Any]]) -> Tuple[List[List[Dict]], Dict]:
+    if PLAYER_CHUNKING == "hash":
+        return bucket_players(players_list)
+    return chunk_players(players_list)
+
+
+def generate_players_data(player_rows: List[pd.DataFrame]) -> Tuple[List[List[Dict]], Dict]:
+    """Generate chunked player data from per-combination player rows"""
+    if not player_rows:
+        return _split_players([])
+    return _split_players(build_players(pd.concat(player_rows, ignore_index=True)))
+
+
+def _chunk_by_id(chunk: List[Dict]) -> Dict[str, Dict]:
+    """A chunk as written to disk: players keyed by ID, so the site can look them up directly"""
+    return {player["id"]: player for player in chunk}
+
+
+class PlayerRowSpill:
+    """Per-combination player rows spilled to disk, partitioned by playerId prefix
+
+    Every row for a player lands in the same partition and the partitions sort
+    in ID order, so players can be assembled one partition at a time. With
+    buckets, the partitions are the hash buckets of PLAYER_CHUNKING = "hash".
+    """
+
+    def __init__(self, prefix_length: int = SPILL_PREFIX_LENGTH, buckets: Optional[int] = None):
+        Path(CACHE_DIR).mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix="player-rows-", dir=CACHE_DIR))
+        self.prefix_length = prefix_length
+        self.buckets = buckets
+
+    def _partition_keys(self, player_ids: pd.Series) -> pd.Series:
+        if self.buckets is not None:
+            return player_ids.map(lambda player_id: f"{player_bucket(player_id, self.buckets):06d}")
+        return player_ids.astype(str).str[: self.prefix_length]
+
+    def add(self, order: int, rows: pd.DataFrame) -> None:
+        """Append one combination's rows; order is its position in the YEARS/PLAYER_TYPES/PROJECTION_SYSTEMS grid"""
+        for key, part in rows.groupby(self._partition_keys(rows["playerId"]), sort=False):
+            with open(self.directory / f"{key}.pkl", "ab") as f:
+                pickle.dump((order, part), f)
+
+    def partitions(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Yield (key, rows) for each partition in key order, with combinations back in grid order"""
+        for path in sorted(self.directory.glob("*.pkl"), key=lambda p: p.stem):
+            parts = []
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        parts.append(pickle.load(f))
+                    except EOFError:
+                        break
+            parts.sort(key=lambda part: part[0])
+            yield path.stem, pd.concat([rows for _, rows in parts], ignore_index=True)
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _previous_chunk_members(data_dir: Path) -> Optional[Dict[int, set]]:
+    """Player IDs per chunk in the saved manifest, or None when there is no usable previous output"""
+    manifest_file = data_dir / "players" / "manifest.json"
+    if not manifest_file.exists():
+        return None
+    with open(manifest_file, encoding="utf-8") as f:
+        previous = json.load(f)
+    # Chunks in an older format have to be rewritten regardless
+    if previous.get("version") != PLAYER_MANIFEST_VERSION:
+        return None
+
+    members: Dict[int, set] = {}
+    for player_id, info in previous.get("players", {}).items():
+        members.setdefault(info.get("chunk"), set()).add(player_id)
+    return members
+
+
+def _chunk_changed(
+    index: int,
+    chunk: List[Dict],
+    previous_members: Dict[int, set],
+    changed_players: set,
+    data_dir: Path,
+) -> bool:
+    """Whether a chunk holds changed players, has different members or is missing on disk"""
+    members = {player["id"] for player in chunk}
+    return bool(
+        members != previous_members.get(index, set())
+        or members & changed_players
+        or not (data_dir / "players" / f"chunk_{index}.json").exists()
+    )
+
+
+def stream_player_chunks(
+    partitions: Iterator[Tuple[str, pd.DataFrame]],
+    data_dir: Path,
+    chunk_size: int = PLAYER_CHUNK_SIZE,
+    changed_players: Optional[set] = None,
+) -> Dict:
+    """Assemble players partition by partition and save each chunk as soon as it fills
+
+    Produces the same files as generate_players_data + save_player_chunks while
+    only one partition and one chunk of players are held in memory. Hash
+    chunking expects the partitions to be the buckets. With changed_players,
+    chunks that are unchanged since the previous output are not rewritten.
+    Returns the manifest.
+    """
+    players_dir = data_dir / "players"
+    players_dir.mkdir(parents=True, exist_ok=True)
+    previous_members = None if changed_players is None else _previous_chunk_members(data_dir)
+
+    manifest_players: Dict[str, Dict[str, Any]] = {}
+    n_chunks = 0
+
+    def write_chunk(chunk: List[Dict]) -> None:
+        nonlocal n_chunks
+        for player in chunk:
+            manifest_players[player["id"]] = {
+                "name": player["name"],
+                "primary_type": player["primary_type"],
+                "chunk": n_chunks,
+            }
+        if previous_members is None or _chunk_changed(
+            n_chunks, chunk, previous_members, changed_players, data_dir
+        ):
+            save_json_file(_chunk_by_id(chunk), players_dir / f"chunk_{n_chunks}.json")
+            print(f"  Saved player chunk {n_chunks} with {len(chunk)} players")
+        n_chunks += 1
+
+    if PLAYER_CHUNKING == "hash":
+        # Every bucket gets a chunk file, empty or not
+        partitions = iter(partitions)
+        current = next(partitions, None)
+        for bucket in range(PLAYER_BUCKETS):
+            if current is not None and int(current[0]) == bucket:
+                write_chunk(build_players(current[1]))
+                current = next(partitions, None)
+            else:
+                write_chunk([])
+        player_manifest = {
+            "version": PLAYER_MANIFEST_VERSION,
+            "total_players": len(manifest_players),
+            "chunking": "hash",
+            "buckets": n_chunks,
+            "total_chunks": n_chunks,
+            "players": dict(sorted(manifest_players.items())),
+        }
+    else:
+        pending: List[Dict] = []
+        for _, rows in partitions:
+            pending.extend(build_players(rows))
+            while len(pending) >= chunk_size:
+                write_chunk(pending[:chunk_size])
+                pending = pending[chunk_size:]
+        if pending:
+            write_chunk(pending)
+
+        player_manifest = {
+            "version": PLAYER_MANIFEST_VERSION,
+            "total_players": len(manifest_players),
+            "chunk_size": chunk_size,
+            "total_chunks": n_chunks,
+            "players": manifest_players,
+        }
+    save_json_file(player_manifest, players_dir / "manifest.json")
+    print(f"  Saved player manifest with {player_manifest['total_players']} total players")
+    return player_manifest
+
+
+def save_player_chunks(
+    player_chunks: List[List[Dict]],
+    player_manifest: Dict,
+    data_dir: Path,
+    only_chunks: Optional[set] = None,
+) -> None:
+    """Save player data chunks and manifest to separate files
+
+    When only_chunks is given, the other chunk files are left as they are.
+    """
     players_dir = data_dir / "players"
     players_dir.mkdir(parents=True, exist_ok=True)
 
     # Save each chunk
     for i, chunk in enumerate(player_chunks):
+        if only_chunks is not None and i not in only_chunks:
+            continue
         chunk_file = players_dir / f"chunk_{i}.json"
-        save_json_file(chunk, chunk_file)
+        save_json_file(_chunk_by_id(chunk), chunk_file)
         print(f"  Saved player chunk {i} with {len(chunk)} players")
 
     # Save the manifest
@@ -792,47 +1441,356 @@ def save_player_chunks(player_chunks: List[List[Dict]], player_manifest: Dict, d
     save_json_file(player_manifest, manifest_file)
     print(f"  Saved player manifest with {player_manifest['total_players']} total players")
 
-def save_json_file(data: Any, filepath: Path) -> None:
-    """Save data as JSON file with proper formatting"""
+@lru_cache(maxsize=None)
+def _orjson():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the NumPy/pandas scalars and arrays the JSON encoders don't handle natively"""
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if pd.isna(obj):
+        return None
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_ready(obj: Any, precision: Optional[int] = None) -> Any:
+    """Convert NumPy/pandas values to plain Python in one pass, with NaN/inf as None
+
+    Floats are rounded to precision decimal places when it is given. Records
+    are already plain Python, so this full walk only runs when rounding or when
+    the data holds something the encoders reject (NaN/inf, NumPy dict keys).
+    """
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else str(int(key)) if isinstance(key, (int, np.integer)) else key:
+            _json_ready(value, precision)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_json_ready(value, precision) for value in obj]
+    if isinstance(obj, str) or obj is None:
+        return obj
+    if isinstance(obj, (bool, np.bool_)):
+        return bool(obj)
+    if isinstance(obj, (int, np.integer)):
+        return int(obj)
+    if isinstance(obj, (float, np.floating)):
+        value = float(obj)
+        if not math.isfinite(value):
+            return None
+        return value if precision is None else round(value, precision)
+    if isinstance(obj, np.ndarray):
+        return _json_ready(obj.tolist(), precision)
+    if pd.isna(obj):
+        return None
+    return obj
+
+
+def save_json_file(data: Any, filepath: Path, pretty: Optional[bool] = None) -> None:
+    """Save data as a JSON file, compact unless pretty (default JSON_PRETTY)"""
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    if pretty is None:
+        pretty = JSON_PRETTY
+    if JSON_FLOAT_PRECISION is not None:
+        data = _json_ready(data, JSON_FLOAT_PRECISION)
+
+    orjson = _orjson()
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | (orjson.OPT_INDENT_2 if pretty else 0)
+        )
+        try:
+            content = orjson.dumps(data, option=option, default=_json_default)
+        except orjson.JSONEncodeError:
+            content = orjson.dumps(_json_ready(data), option=option)
+        with open(filepath, "wb") as f:
+            f.write(content)
+        return
+
+    options = {"indent": 2} if pretty else {"separators": (",", ":")}
+    try:
+        content = json.dumps(
+            data, ensure_ascii=False, allow_nan=False, default=_json_default, **options
+        )
+    except (TypeError, ValueError):
+        # NaN/inf floats (written as null) or NumPy dict keys need the full conversion pass
+        content = json.dumps(_json_ready(data), ensure_ascii=False, **options)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def evaluate_year_player_type(
+    year: int,
+    player_type: str,
+    actual_stats: Optional[ActualStatsProvider] = None,
+    systems: Optional[Sequence[str]] = None,
+    wide: bool = False,
+) -> List[Tuple[str, List[ProjectionResult], Optional[pd.DataFrame]]]:
+    """Evaluate projection systems (all by default) for one year and player type
+
+    Returns (system, results, player rows) for each system.
+    """
+    if actual_stats is None:
+        actual_df = load_actual_stats(year, player_type)
+    else:
+        actual_df = actual_stats.get(year, player_type)
 
-    class NumpyEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                if np.isnan(obj) or pd.isna(obj) or np.isinf(obj):
-                    return None
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif pd.isna(obj):
-                return None
-            return super().default(obj)
+    if systems is None:
+        systems = PROJECTION_SYSTEMS
+    if wide:
+        return process_year_wide(year, player_type, actual_df, systems)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+    outputs = []
+    for system in systems:
+        results, merged_df = process_year_system(
+            year, system, player_type, actual_df=actual_df
+        )
+        rows = None if merged_df is None else _player_rows(year, system, player_type, merged_df)
+        outputs.append((system, results, rows))
+    return outputs
+
+
+def _evaluate_task(
+    task: Tuple[int, str, Tuple[str, ...]],
+    wide: bool = False,
+) -> List[Tuple[str, List[ProjectionResult], Optional[pd.DataFrame]]]:
+    year, player_type, systems = task
+    return evaluate_year_player_type(year, player_type, systems=systems, wide=wide)
+
+
+def evaluate_grid(
+    workers: Optional[int] = None,
+    tasks: Optional[List[Tuple[int, str, Tuple[str, ...]]]] = None,
+    wide: bool = False,
+) -> Iterator[Tuple[int, str, List[Tuple[str, List[ProjectionResult], Optional[pd.DataFrame]]]]]:
+    """Evaluate the year x player_type grid, yielding outputs in YEARS/PLAYER_TYPES order.
+
+    tasks limits the run to (year, player_type, systems) entries. With more
+    than one worker the tasks run in a process pool; results are still
+    yielded in task order so the output matches a serial run exactly.
+    """
+    if tasks is None:
+        tasks = [
+            (year, player_type, tuple(PROJECTION_SYSTEMS))
+            for year in YEARS
+            for player_type in PLAYER_TYPES
+        ]
+    if workers is None:
+        workers = MAX_WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        actual_stats = ActualStatsProvider()
+        for i, (year, player_type, systems) in enumerate(tasks, start=1):
+            print(f"\nProgress: {i}/{len(tasks)}")
+            yield year, player_type, evaluate_year_player_type(
+                year, player_type, actual_stats, systems, wide
+            )
+        actual_stats.clear()
+        return
 
+    print(f"Evaluating {len(tasks)} year/player type combinations with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, ((year, player_type, _), outputs) in enumerate(
+            zip(tasks, executor.map(partial(_evaluate_task, wide=wide), tasks)), start=1
+        ):
+            print(f"\nProgress: {i}/{len(tasks)} ({year} {player_type} done)")
+            yield year, player_type, outputs
 
-def run_evaluation():
-    """Main function to run the complete evaluation and generate JSON files"""
-    print("Starting projection evaluation...")
 
-    # Process all year/system/player_type combinations
-    all_results = []
-    merged_dataframes = {}
-    total_combinations = len(YEARS) * len(PROJECTION_SYSTEMS) * len(PLAYER_TYPES)
-    current_combination = 0
+def _evaluation_cache_dir() -> Path:
+    return Path(CACHE_DIR) / "evaluation"
+
+
+def _load_evaluation_manifest() -> Dict:
+    """Input fingerprints and file digests recorded by the last incremental run"""
+    manifest_file = _evaluation_cache_dir() / "manifest.json"
+    if manifest_file.exists():
+        with open(manifest_file, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == EVALUATION_VERSION:
+            return manifest
+    return {"version": EVALUATION_VERSION, "files": {}, "cells": {}}
+
+
+def _input_digest(file_path: Path, files: Dict[str, List]) -> str:
+    """Digest of an input file, reusing the recorded one while its size and mtime are unchanged"""
+    if not file_path.exists():
+        return "missing"
+    stat = file_path.stat()
+    known = files.get(str(file_path))
+    if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+        return known[2]
+    digest = _file_digest(file_path)
+    files[str(file_path)] = [stat.st_mtime_ns, stat.st_size, digest]
+    return digest
+
+
+def _cell_fingerprint(
+    year: int, player_type: str, system: str, files: Dict[str, List], wide: bool = False
+) -> str:
+    """Fingerprint of everything a year/player_type/system combination's output depends on"""
+    parts = [
+        EVALUATION_VERSION,
+        BIGGEST_MISSES_COUNT,
+        sorted(BIGGEST_MISSES_BY_STAT.items()),
+        _input_digest(_actual_stats_path(year, player_type), files),
+        _input_digest(_projection_path(year, system, player_type), files),
+        _input_digest(Path(STATS_DIR) / "woba.csv", files),
+        COMPACT_DTYPES,
+        FLOAT32_RATE_STATS,
+    ]
+    if wide:
+        parts.append("wide")
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _cell_artifact_path(year: int, player_type: str, system: str) -> Path:
+    return _evaluation_cache_dir() / f"{year}_{system}_{player_type}.pkl"
+
+
+def _changed_player_ids(previous: Optional[pd.DataFrame], current: Optional[pd.DataFrame]) -> set:
+    """Players whose rows differ between two runs of a combination, including added and removed players"""
+    def by_player(rows):
+        if rows is None:
+            return {}
+        return dict(
+            zip(rows["playerId"], zip(rows["playerName"], rows["actual"], rows["projected"]))
+        )
+
+    before, after = by_player(previous), by_player(current)
+    return {
+        player_id
+        for player_id in before.keys() | after.keys()
+        if before.get(player_id) != after.get(player_id)
+    }
 
-    for year in YEARS:
-        for system in PROJECTION_SYSTEMS:
-            for player_type in PLAYER_TYPES:
-                current_combination += 1
-                print(f"\nProgress: {current_combination}/{total_combinations}")
-                results, merged_df = process_year_system(year, system, player_type)
-                all_results.extend(results)
-                if merged_df is not None:
-                    merged_dataframes[(year, system, player_type)] = merged_df
+
+def _chunks_to_rewrite(
+    player_chunks: List[List[Dict]],
+    data_dir: Path,
+    changed_players: set,
+) -> Optional[set]:
+    """Chunks that hold changed players or whose membership moved since the saved manifest
+
+    Returns None (rewrite everything) when there is no usable previous output.
+    """
+    previous_members = _previous_chunk_members(data_dir)
+    if previous_members is None:
+        return None
+    return {
+        i
+        for i, chunk in enumerate(player_chunks)
+        if _chunk_changed(i, chunk, previous_members, changed_players, data_dir)
+    }
+
+
+def run_evaluation(
+    workers: Optional[int] = None,
+    incremental: Optional[bool] = None,
+    streaming: Optional[bool] = None,
+    wide: Optional[bool] = None,
+):
+    """Main function to run the complete evaluation and generate JSON files
+
+    workers sets the number of evaluation processes (defaults to MAX_WORKERS, then the CPU count).
+    incremental (default INCREMENTAL) reuses saved results for combinations whose inputs are unchanged.
+    streaming (default STREAM_PLAYER_CHUNKS) spills player rows to disk and writes chunks one at a time.
+    wide (default WIDE_EVALUATION) evaluates all systems for a year against one wide table.
+    """
+    print("Starting projection evaluation...")
+    if incremental is None:
+        incremental = INCREMENTAL
+    if streaming is None:
+        streaming = STREAM_PLAYER_CHUNKS
+    if wide is None:
+        wide = WIDE_EVALUATION
+
+    cells = [
+        (year, player_type, system)
+        for year in YEARS
+        for player_type in PLAYER_TYPES
+        for system in PROJECTION_SYSTEMS
+    ]
+    cell_order = {cell: i for i, cell in enumerate(cells)}
+    # (results, player rows) for each year/player_type/system combination.
+    # When streaming, the rows go to the spill instead.
+    outputs: Dict[Tuple[int, str, str], Tuple[List[ProjectionResult], Optional[pd.DataFrame]]] = {}
+    changed_players: set = set()
+    # Player rows from the last run of combinations being re-evaluated
+    previous_rows: Dict[Tuple[int, str, str], Optional[pd.DataFrame]] = {}
+    spill = None
+    if streaming:
+        spill = PlayerRowSpill(buckets=PLAYER_BUCKETS if PLAYER_CHUNKING == "hash" else None)
+
+    def keep(cell, results, rows):
+        if spill is not None and rows is not None:
+            spill.add(cell_order[cell], rows)
+            rows = None
+        outputs[cell] = (results, rows)
+
+    if incremental:
+        manifest = _load_evaluation_manifest()
+        fingerprints = {
+            cell: _cell_fingerprint(*cell, manifest["files"], wide) for cell in cells
+        }
+        for cell in cells:
+            artifact = _cell_artifact_path(*cell)
+            if not artifact.exists():
+                continue
+            with open(artifact, "rb") as f:
+                saved = pickle.load(f)
+            if manifest["cells"].get("/".join(map(str, cell))) == fingerprints[cell]:
+                keep(cell, *saved)
+            else:
+                previous_rows[cell] = saved[1]
+        print(f"Incremental run: {len(cells) - len(outputs)} of {len(cells)} combinations changed")
+
+    # Process the year/system/player_type combinations still to evaluate. Each
+    # (year, player_type) task evaluates its systems against a single load of
+    # the actual stats.
+    tasks: Dict[Tuple[int, str], List[str]] = {}
+    for year, player_type, system in cells:
+        if (year, player_type, system) not in outputs:
+            tasks.setdefault((year, player_type), []).append(system)
+
+    for year, player_type, system_outputs in evaluate_grid(
+        workers,
+        [(year, player_type, tuple(systems)) for (year, player_type), systems in tasks.items()],
+        wide,
+    ):
+        for system, results, rows in system_outputs:
+            cell = (year, player_type, system)
+            if incremental:
+                changed_players.update(_changed_player_ids(previous_rows.pop(cell, None), rows))
+                artifact = _cell_artifact_path(*cell)
+                artifact.parent.mkdir(parents=True, exist_ok=True)
+                with open(artifact, "wb") as f:
+                    pickle.dump((results, rows), f)
+                manifest["cells"]["/".join(map(str, cell))] = fingerprints[cell]
+            keep(cell, results, rows)
+
+    if incremental:
+        with open(_evaluation_cache_dir() / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    all_results = [result for cell in cells for result in outputs[cell][0]]
+    player_rows = [outputs[cell][1] for cell in cells if outputs[cell][1] is not None]
 
     print(f"\nCompleted evaluation. Total results: {len(all_results)}")
 
@@ -918,39 +1876,152 @@ def run_evaluation():
 
         years_data[str(year)] = {"batting": batting_data, "pitching": pitching_data}
 
-    # Generate and save player data in chunks
-    print("\nGenerating player data chunks...")
-    player_chunks, player_manifest = generate_players_data_from_merged(merged_dataframes)
-
     # Save all files
     print("\nSaving JSON files...")
     save_json_file(site_data, data_dir / "site.json")
     save_json_file(years_data, data_dir / "years.json")
-    save_player_chunks(player_chunks, player_manifest, data_dir)
+
+    # Generate and save player data in chunks
+    print("\nGenerating player data chunks...")
+    if spill is not None:
+        player_manifest = stream_player_chunks(
+            spill.partitions(),
+            data_dir,
+            changed_players=changed_players if incremental else None,
+        )
+        spill.cleanup()
+    else:
+        player_chunks, player_manifest = generate_players_data(player_rows)
+        only_chunks = (
+            _chunks_to_rewrite(player_chunks, data_dir, changed_players) if incremental else None
+        )
+        save_player_chunks(player_chunks, player_manifest, data_dir, only_chunks)
 
     print(f"\nJSON generation complete!")
     print(f"  Site data: {len(site_data['years'])} years")
     print(f"  Years data: {len(years_data)} years with results")
-    print(f"  Players data: {len(player_chunks)} chunks with {player_manifest['total_players']} total players")
+    print(f"  Players data: {player_manifest['total_chunks']} chunks with {player_manifest['total_players']} total players")
     print(f"  Files saved to: {data_dir}")
 
 
+def _evaluate_stats(
+    year: int,
+    system: str,
+    player_type: str,
+    evaluated_stats: List[str],
+    actual_matrix: np.ndarray,
+    proj_matrix: np.ndarray,
+    weights: np.ndarray,
+    actual_league_avgs: Dict[str, float],
+    proj_league_avgs: Dict[str, float],
+    players: pd.DataFrame,
+) -> List[ProjectionResult]:
+    """Metrics and biggest misses for each evaluated stat
+
+    The matrices hold one column per evaluated stat, row-aligned with players
+    (which supplies playerId and playerName for the biggest misses).
+    """
+    rate_stats = stat_names(player_type, ["rate"])
+
+    # 5, 6, 7: Calculate all metric versions for every stat in one batch
+    is_rate = np.array([stat in rate_stats for stat in evaluated_stats], dtype=bool)
+    actual_offsets = np.array(
+        [actual_league_avgs[stat] if stat in rate_stats else 0.0 for stat in evaluated_stats]
+    )
+    proj_offsets = np.array(
+        [proj_league_avgs[stat] if stat in rate_stats else 0.0 for stat in evaluated_stats]
+    )
+    metrics = calculate_metrics_batch(
+        actual_matrix, proj_matrix, weights, actual_offsets, proj_offsets
+    )
+
+    # For volume stats we only really care about the raw error
+    for variant in ("la_", "wla_"):
+        for name in ("rmse", "mae", "bias", "r_squared"):
+            metrics[f"{variant}{name}"][~is_rate] = metrics[name][~is_rate]
+
+    results = []
+
+    for j, stat in enumerate(evaluated_stats):
+        if metrics["n_players"][j] == 0:
+            continue
+
+        # Remove any rows with NaN values
+        mask = ~(np.isnan(actual_matrix[:, j]) | np.isnan(proj_matrix[:, j]))
+        actual_clean = actual_matrix[mask, j]
+        proj_clean = proj_matrix[mask, j]
+
+        if is_rate[j]:
+            # Determine error for biggest misses based on weighted league-adjusted error
+            actual_la = actual_clean - actual_offsets[j]
+            proj_la = proj_clean - proj_offsets[j]
+            miss_errors = np.abs(actual_la - proj_la) * weights[mask]
+        else:
+            # Determine error for biggest misses based on raw error
+            miss_errors = np.abs(actual_clean - proj_clean)
+
+        biggest_misses = find_biggest_misses(
+            players,
+            np.flatnonzero(mask),
+            miss_errors,
+            actual_clean,
+            proj_clean,
+            BIGGEST_MISSES_BY_STAT.get(stat, BIGGEST_MISSES_COUNT),
+        )
+
+        result = ProjectionResult(
+            year=year,
+            system=system,
+            player_type=player_type,
+            stat=stat,
+            rmse=metrics["rmse"][j],
+            mae=metrics["mae"][j],
+            bias=metrics["bias"][j],
+            r_squared=metrics["r_squared"][j],
+            la_rmse=metrics["la_rmse"][j],
+            la_mae=metrics["la_mae"][j],
+            la_bias=metrics["la_bias"][j],
+            la_r_squared=metrics["la_r_squared"][j],
+            wla_rmse=metrics["wla_rmse"][j],
+            wla_mae=metrics["wla_mae"][j],
+            wla_bias=metrics["wla_bias"][j],
+            wla_r_squared=metrics["wla_r_squared"][j],
+            n_players=int(metrics["n_players"][j]),
+            biggest_misses=biggest_misses,
+        )
+
+        results.append(result)
+        print(
+            f"    {stat}: RMSE={result.rmse:.4f}, LA-RMSE={result.la_rmse:.4f}, WLA-RMSE={result.wla_rmse:.4f}"
+        )
+
+    return results
+
+
 def process_year_system(
-    year: int, system: str, player_type: str
+    year: int,
+    system: str,
+    player_type: str,
+    actual_df: Optional[pd.DataFrame] = None,
+    float32_rates: Optional[bool] = None,
 ) -> tuple[List[ProjectionResult], Optional[pd.DataFrame]]:
-    """Process a specific year/system/player_type combination and return both results and merged df"""
+    """Process a specific year/system/player_type combination and return both results and merged df
+
+    Pass an already loaded actual_df (which is not modified) to share it across systems.
+    float32_rates overrides FLOAT32_RATE_STATS for the loaded frames.
+    """
     print(f"Processing {system} {year} {player_type}...")
 
     # 1. Load actual stats and projected stats
-    actual_df = load_actual_stats(year, player_type)
-    proj_df = load_projections(year, system, player_type)
+    if actual_df is None:
+        actual_df = load_actual_stats(year, player_type, float32_rates=float32_rates)
+    proj_df = load_projections(year, system, player_type, float32_rates=float32_rates)
 
     if actual_df.empty or proj_df.empty:
         print(f"  Skipping - missing data")
         return [], None
 
-    # Ensure consistent data types
-    actual_df["playerId"] = actual_df["playerId"].astype(str)
+    # Ensure consistent data types (load_actual_stats already stores playerId as str)
     proj_df["xMLBAMID"] = proj_df["xMLBAMID"].astype(str)
 
     # 2. Calculate league averages for actual stats
@@ -963,7 +2034,7 @@ def process_year_system(
     actual_league_avgs = {}
     for stat in rate_stats:
         if stat in actual_df.columns and playing_time_col in actual_df.columns:
-            weights = actual_df[playing_time_col]
+            weights = actual_df[playing_time_col].to_numpy(dtype=float, na_value=np.nan)
             actual_league_avgs[stat] = np.average(actual_df[stat], weights=weights)
 
     # 3. Join projection data, filling missing players with league averages
@@ -989,7 +2060,7 @@ def process_year_system(
     for stat in rate_stats:
         proj_col = f"{stat}_y"
         if proj_col in merged_df.columns and playing_time_col_y in merged_df.columns:
-            weights = merged_df[playing_time_col_y]
+            weights = merged_df[playing_time_col_y].to_numpy(dtype=float, na_value=np.nan)
             proj_league_avgs[stat] = np.average(merged_df[proj_col], weights=weights)
 
     # Add league-adjusted columns to merged_df
@@ -1016,104 +2087,181 @@ def process_year_system(
 
     print(f"  Found {len(merged_df)} players")
 
-    results = []
-
-    for stat in all_stats:
-        actual_col = f"{stat}_x"
-        proj_col = f"{stat}_y"
+    # Stats present on both sides with at least one value each
+    evaluated_stats = [
+        stat
+        for stat in all_stats
+        if f"{stat}_x" in merged_df.columns
+        and f"{stat}_y" in merged_df.columns
+        and merged_df[f"{stat}_x"].notna().any()
+        and merged_df[f"{stat}_y"].notna().any()
+    ]
+
+    # Get the correct playing time column for weights
+    # Check if the _x suffix version exists, otherwise use the original column name
+    if playing_time_col_x in merged_df.columns:
+        weights = merged_df[playing_time_col_x].to_numpy(dtype=float, na_value=np.nan)
+    elif playing_time_col in merged_df.columns:
+        weights = merged_df[playing_time_col].to_numpy(dtype=float, na_value=np.nan)
+    else:
+        # If neither exists, use equal weights (all 1s)
+        weights = np.ones(len(merged_df))
+
+    results = _evaluate_stats(
+        year,
+        system,
+        player_type,
+        evaluated_stats,
+        _float_matrix(merged_df, [f"{stat}_x" for stat in evaluated_stats]),
+        _float_matrix(merged_df, [f"{stat}_y" for stat in evaluated_stats]),
+        weights,
+        actual_league_avgs,
+        proj_league_avgs,
+        merged_df,
+    )
 
-        if actual_col not in merged_df.columns or proj_col not in merged_df.columns:
-            continue
+    return results, merged_df
 
-        # Get actual and projected values
-        actual_vals = merged_df[actual_col]
-        proj_vals = merged_df[proj_col]
 
-        if actual_vals.isna().all() or proj_vals.isna().all():
+def build_wide_table(actual_df: pd.DataFrame, projections: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One row per actual stats row, indexed by playerId, with column blocks
+    ("Actual", then one per system) as the first column level
+
+    Each system's projections are deduplicated on xMLBAMID (first row wins) and
+    aligned to the actual rows, so players without a projection get NaN.
+    """
+    actual = actual_df.set_index("playerId", drop=False)
+    blocks = {"Actual": actual}
+    for system, proj_df in projections.items():
+        proj = proj_df.drop_duplicates(subset="xMLBAMID").set_index("xMLBAMID")
+        blocks[system] = proj.reindex(actual.index)
+    return pd.concat(blocks, axis=1)
+
+
+def process_year_wide(
+    year: int,
+    player_type: str,
+    actual_df: Optional[pd.DataFrame] = None,
+    systems: Optional[Sequence[str]] = None,
+    float32_rates: Optional[bool] = None,
+) -> List[Tuple[str, List[ProjectionResult], Optional[pd.DataFrame]]]:
+    """Evaluate several systems for a year/player_type against one wide table
+
+    Returns (system, results, player rows) per system, like evaluate_year_player_type.
+    """
+    if actual_df is None:
+        actual_df = load_actual_stats(year, player_type, float32_rates=float32_rates)
+    if systems is None:
+        systems = PROJECTION_SYSTEMS
+
+    projections = {}
+    for system in systems:
+        print(f"Processing {system} {year} {player_type}...")
+        proj_df = load_projections(year, system, player_type, float32_rates=float32_rates)
+        if actual_df.empty or proj_df.empty:
+            print("  Skipping - missing data")
             continue
+        proj_df["xMLBAMID"] = proj_df["xMLBAMID"].astype(str)
+        projections[system] = proj_df
 
-        # Remove any rows with NaN values
-        mask = ~(actual_vals.isna() | proj_vals.isna())
-        actual_clean = actual_vals[mask].values
-        proj_clean = proj_vals[mask].values
+    if not projections:
+        return [(system, [], None) for system in systems]
 
-        if len(actual_clean) == 0:
-            continue
-
-        # Get the correct playing time column for weights
-        # Check if the _x suffix version exists, otherwise use the original column name
-        if playing_time_col_x in merged_df.columns:
-            weights = merged_df[playing_time_col_x][mask].values
-        elif playing_time_col in merged_df.columns:
-            weights = merged_df[playing_time_col][mask].values
-        else:
-            # If neither exists, use equal weights (all 1s)
-            weights = np.ones(len(actual_clean))
-
-        # 5, 6, 7: Calculate all metric versions and find biggest misses
-        if stat in rate_stats:
-            # League-adjusted (stat - league_avg)
-            actual_la = actual_clean - actual_league_avgs[stat]
-            proj_la = proj_clean - proj_league_avgs[stat]
-
-            # Calculate the three types of metrics
-            raw_metrics = calculate_metrics(actual_clean, proj_clean) # Unweighted raw
-            la_metrics = calculate_metrics(actual_la, proj_la)  # Unweighted league-adjusted
-            wla_metrics = calculate_metrics(
-                actual_la, proj_la, weights=weights
-            )  # Weighted league-adjusted
+    table = build_wide_table(actual_df, projections)
+    actual = table["Actual"]
+    players = actual[["playerId", "playerName"] if "playerName" in actual.columns else ["playerId"]]
+    first_rows = ~players["playerId"].duplicated().to_numpy()
 
-            # Determine error for biggest misses based on weighted league-adjusted error
-            miss_errors = np.abs(actual_la - proj_la) * weights
-        else: # Volume stats
-            # For volume stats, we only really care about the raw error.
-            raw_metrics = calculate_metrics(actual_clean, proj_clean)
-            la_metrics = raw_metrics  # No separate league adjustment
-            wla_metrics = raw_metrics # No separate weighting scheme for volume stats
+    rate_stats = stat_names(player_type, ["rate"])
+    volume_stats = stat_names(player_type, ["volume"])
+    all_stats = rate_stats + volume_stats
+    playing_time_col = "PA" if player_type == "batting" else "BF"
 
-            # Determine error for biggest misses based on raw error
-            miss_errors = np.abs(actual_clean - proj_clean)
+    actual_league_avgs = {}
+    for stat in rate_stats:
+        if stat in actual.columns and playing_time_col in actual.columns:
+            actual_league_avgs[stat] = np.average(
+                actual[stat], weights=actual[playing_time_col].to_numpy(dtype=float, na_value=np.nan)
+            )
 
-        temp_df = merged_df[mask].copy()
-        temp_df["miss_error"] = miss_errors
-        temp_df["actual_for_misses"] = actual_clean
-        temp_df["proj_for_misses"] = proj_clean
+    outputs = []
+    for system in systems:
+        if system not in projections:
+            outputs.append((system, [], None))
+            continue
 
-        biggest_misses = find_biggest_misses(
-            temp_df,
-            stat,
-            "actual_for_misses",
-            "proj_for_misses",
-            error_col="miss_error",
-        )
+        proj_columns = set(projections[system].columns)
+        # Stats on both sides, as a merge would suffix them
+        shared = [stat for stat in stat_names(player_type) if stat in actual.columns and stat in proj_columns]
+        projected = table[system][shared]
+
+        # Fill missing projections with league averages for rate stats and 1 for playing-time stats
+        fills = {stat: actual_league_avgs[stat] for stat in rate_stats if stat in shared and stat in actual_league_avgs}
+        fills.update({stat: 1 for stat in volume_stats if stat in shared})
+        projected = projected.fillna(fills)
+
+        proj_league_avgs = {}
+        for stat in rate_stats:
+            if stat in shared and playing_time_col in shared:
+                proj_league_avgs[stat] = np.average(
+                    projected[stat],
+                    weights=projected[playing_time_col].to_numpy(dtype=float, na_value=np.nan),
+                )
 
-        result = ProjectionResult(
-            year=year,
-            system=system,
-            player_type=player_type,
-            stat=stat,
-            rmse=raw_metrics["rmse"],
-            mae=raw_metrics["mae"],
-            bias=raw_metrics["bias"],
-            r_squared=raw_metrics["r_squared"],
-            la_rmse=la_metrics["rmse"],
-            la_mae=la_metrics["mae"],
-            la_bias=la_metrics["bias"],
-            la_r_squared=la_metrics["r_squared"],
-            wla_rmse=wla_metrics["rmse"],
-            wla_mae=wla_metrics["mae"],
-            wla_bias=wla_metrics["bias"],
-            wla_r_squared=wla_metrics["r_squared"],
-            n_players=len(actual_clean),
-            biggest_misses=biggest_misses,
+        # League-adjusted columns, with the names used in the player data
+        la_actual = {}
+        la_proj = {}
+        for stat in rate_stats:
+            if stat in shared and stat in actual_league_avgs and stat in proj_league_avgs:
+                la_actual[f"{stat}_la"] = actual[stat] - actual_league_avgs[stat]
+                la_proj[f"{stat}_la"] = projected[stat] - proj_league_avgs[stat]
+
+        print(f"  Found {len(actual)} players")
+
+        evaluated_stats = [
+            stat
+            for stat in all_stats
+            if stat in shared and actual[stat].notna().any() and projected[stat].notna().any()
+        ]
+
+        if playing_time_col in actual.columns:
+            weights = actual[playing_time_col].to_numpy(dtype=float, na_value=np.nan)
+        elif playing_time_col in proj_columns:
+            weights = table[system][playing_time_col].to_numpy(dtype=float, na_value=np.nan)
+        else:
+            weights = np.ones(len(actual))
+
+        results = _evaluate_stats(
+            year,
+            system,
+            player_type,
+            evaluated_stats,
+            _float_matrix(actual, evaluated_stats),
+            _float_matrix(projected, evaluated_stats),
+            weights,
+            actual_league_avgs,
+            proj_league_avgs,
+            players,
         )
 
-        results.append(result)
-        print(
-            f"    {stat}: RMSE={raw_metrics['rmse']:.4f}, LA-RMSE={la_metrics['rmse']:.4f}, WLA-RMSE={wla_metrics['rmse']:.4f}"
+        # Like a per-player lookup, use the first row when a player appears more than once
+        actual_payload = actual[
+            [stat for stat in stat_names(player_type) if stat in actual.columns]
+        ].assign(**la_actual)[first_rows]
+        projected_payload = projected.assign(**la_proj)[first_rows]
+        rows = _rows_from_columns(
+            year,
+            system,
+            player_type,
+            players[first_rows],
+            actual_payload,
+            {name: name for name in actual_payload.columns},
+            projected_payload,
+            {name: name for name in projected_payload.columns},
         )
+        outputs.append((system, results, rows))
 
-    return results, merged_df
+    return outputs
 
 
 if __name__ == "__main__":
@@ -21,7 +21,10 @@ module.exports = function () {
     return { items: [], getPlayer: () => null, getPlayerName: () => "Unknown Player" };
   }
 
-  // Create a map to cache loaded chunks
+  // Version 2 chunks are objects keyed by player ID; older (unversioned) chunks are arrays
+  const keyedChunks = (manifest.version || 1) >= 2;
+
+  // Create a map to cache loaded chunks, each as a Map from player ID to player
   const chunkCache = new Map();
 
   // Function to load a chunk
@@ -30,24 +33,25 @@ module.exports = function () {
       const chunkPath = path.join(__dirname, "players", `chunk_${chunkNum}.json`);
       if (!fs.existsSync(chunkPath)) {
         console.warn("Player chunk file not found:", chunkPath);
-        chunkCache.set(chunkNum, []);
-        return [];
+        chunkCache.set(chunkNum, new Map());
+        return chunkCache.get(chunkNum);
       }
       try {
         const chunk = JSON.parse(fs.readFileSync(chunkPath, "utf8"));
-        if (!Array.isArray(chunk)) {
+        if (Array.isArray(chunk) && !keyedChunks) {
+          chunkCache.set(chunkNum, new Map(chunk.map((p) => [p.id, p])));
+        } else if (chunk && typeof chunk === "object" && !Array.isArray(chunk) && keyedChunks) {
+          chunkCache.set(chunkNum, new Map(Object.entries(chunk)));
+        } else {
           console.error("Invalid chunk data structure:", chunkPath);
-          chunkCache.set(chunkNum, []);
-          return [];
+          chunkCache.set(chunkNum, new Map());
         }
-        chunkCache.set(chunkNum, chunk);
       } catch (error) {
         console.error("Error loading player chunk:", chunkPath, error);
-        chunkCache.set(chunkNum, []);
-        return [];
+        chunkCache.set(chunkNum, new Map());
       }
     }
-    return chunkCache.get(chunkNum) || [];
+    return chunkCache.get(chunkNum);
   }
 
   // Return an object with the player IDs array and helper functions
@@ -57,8 +61,7 @@ module.exports = function () {
       const playerInfo = manifest.players[playerId];
       if (!playerInfo) return null;
 
-      const chunk = loadChunk(playerInfo.chunk);
-      return chunk.find((p) => p.id === playerId) || null;
+      return loadChunk(playerInfo.chunk).get(playerId) || null;
     },
     getPlayerName: function (playerId) {
       const playerInfo = manifest.players[playerId];
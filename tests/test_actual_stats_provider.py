@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import projection_evaluation as pe  # noqa: E402
+
+
+def test_modifying_a_provided_frame_leaves_the_cache_intact(tmp_path, monkeypatch):
+    stats_file = tmp_path / "2023_bat.csv"
+    stats_file.write_text("playerId,AVG\n1,0.250\n")
+    loads = []
+
+    def load_actual_stats(year, player_type):
+        loads.append((year, player_type))
+        return pd.DataFrame({"playerId": ["1"], "AVG": [0.25]})
+
+    monkeypatch.setattr(pe, "_actual_stats_path", lambda year, player_type: stats_file)
+    monkeypatch.setattr(pe, "load_actual_stats", load_actual_stats)
+
+    provider = pe.ActualStatsProvider()
+    first = provider.get(2023, "batting")
+    first.loc[0, "AVG"] = 0.999
+    first["AVG"] *= 2
+
+    second = provider.get(2023, "batting")
+    assert second.loc[0, "AVG"] == 0.25
+    assert loads == [(2023, "batting")]
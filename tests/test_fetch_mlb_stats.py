@@ -0,0 +1,152 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "utils"))
+
+import fetch_mlb_stats  # noqa: E402
+from fetch_mlb_stats import TokenBucket  # noqa: E402
+from http_cache import HttpCache, season_end  # noqa: E402
+
+
+def make_response(status: int, body: bytes = b"") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    return response
+
+
+def test_malformed_body_is_not_frozen(tmp_path, monkeypatch):
+    cache = HttpCache(tmp_path, clock=lambda: datetime(2025, 2, 1))
+    bodies = [b'{"stats": [{"splits": [', b'{"stats": []}']
+    requests_made = []
+
+    def get(url, headers):
+        requests_made.append(url)
+        return make_response(200, bodies[len(requests_made) - 1])
+
+    monkeypatch.setattr(fetch_mlb_stats, "get_http_cache", lambda: cache)
+    monkeypatch.setattr(fetch_mlb_stats, "_get_with_retries", get)
+    url = "https://example.test/stats?season=2024"
+
+    # A truncated 200 fetched after the season doesn't parse...
+    with pytest.raises(ValueError):
+        fetch_mlb_stats.fetch_json(url, frozen_after=season_end(2024))
+
+    # ...so it isn't served from disk on the next run
+    assert fetch_mlb_stats.fetch_json(url, frozen_after=season_end(2024)) == {"stats": []}
+    assert len(requests_made) == 2
+    assert fetch_mlb_stats.fetch_json(url, frozen_after=season_end(2024)) == {"stats": []}
+    assert len(requests_made) == 2
+
+
+def test_malformed_bio_batch_is_skipped(tmp_path, monkeypatch):
+    cache = HttpCache(tmp_path)
+    monkeypatch.setattr(fetch_mlb_stats, "get_http_cache", lambda: cache)
+    monkeypatch.setattr(
+        fetch_mlb_stats, "_get_with_retries", lambda url, headers: make_response(200, b'{"people": [')
+    )
+
+    assert fetch_mlb_stats.get_player_bio_data([1, 2]) == []
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeSession:
+    """Answers each get() with the next of a list of statuses (or exceptions)"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        outcome = self.outcomes[self.calls]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = make_response(outcome, b"{}")
+        if outcome == 429:
+            response.headers["Retry-After"] = "7"
+        return response
+
+
+@pytest.fixture
+def fake_network(monkeypatch):
+    """Patches in a FakeSession and an unlimited rate limiter, recording backoff sleeps"""
+    clock = FakeClock()
+    monkeypatch.setattr(fetch_mlb_stats.time, "sleep", clock.sleep)
+    monkeypatch.setattr(fetch_mlb_stats, "get_rate_limiter", lambda: TokenBucket(1e9, 100, clock))
+
+    def install(outcomes):
+        session = FakeSession(outcomes)
+        monkeypatch.setattr(fetch_mlb_stats, "get_session", lambda: session)
+        return session, clock
+
+    return install
+
+
+def test_transient_failures_are_retried(fake_network):
+    session, clock = fake_network([503, requests.exceptions.ConnectionError("reset"), 429, 200])
+
+    response = fetch_mlb_stats._get_with_retries("https://example.test/stats", {})
+    assert response.status_code == 200
+    assert session.calls == 4
+    # Backoff grows with each attempt, and Retry-After is honoured as given
+    assert len(clock.sleeps) == 3
+    assert 0.5 <= clock.sleeps[0] <= 1.5
+    assert 1.0 <= clock.sleeps[1] <= 3.0
+    assert clock.sleeps[2] == 7
+
+
+def test_gives_up_after_max_retries(fake_network, monkeypatch):
+    monkeypatch.setattr(fetch_mlb_stats, "MAX_RETRIES", 2)
+    session, clock = fake_network([503, 503, 503, 200])
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch_mlb_stats._get_with_retries("https://example.test/stats", {})
+    assert session.calls == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_client_errors_are_not_retried(fake_network):
+    session, clock = fake_network([404, 200])
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch_mlb_stats._get_with_retries("https://example.test/stats", {})
+    assert session.calls == 1
+    assert clock.sleeps == []
+
+
+def test_token_bucket_paces_requests_after_a_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    sent_at = []
+    for _ in range(6):
+        bucket.acquire()
+        sent_at.append(clock.now)
+
+    # The burst goes out at once, then one request every 1/rate seconds
+    assert sent_at == pytest.approx([0, 0, 0, 0.5, 1.0, 1.5])
+
+    # Tokens refill while idle, up to the capacity
+    clock.now += 10
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == pytest.approx(11.5)
@@ -0,0 +1,127 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import projection_evaluation as pe  # noqa: E402
+
+METRICS = [
+    "rmse",
+    "mae",
+    "bias",
+    "r_squared",
+    "la_rmse",
+    "la_mae",
+    "la_bias",
+    "la_r_squared",
+    "wla_rmse",
+    "wla_mae",
+    "wla_bias",
+    "wla_r_squared",
+]
+
+# Bias sits near zero, where a relative bound means nothing
+BIAS_ABS_TOLERANCE = 1e-6
+
+
+def write_fixture(root: Path, year: int = 2023, players: int = 200) -> None:
+    rng = np.random.default_rng(7)
+    (root / "stats").mkdir()
+    (root / "projections").mkdir()
+    pd.DataFrame(
+        {
+            "Season": [year],
+            "wBB": [0.696],
+            "wHBP": [0.726],
+            "w1B": [0.883],
+            "w2B": [1.244],
+            "w3B": [1.569],
+            "wHR": [2.004],
+        }
+    ).to_csv(root / "stats" / "woba.csv", index=False)
+
+    ids = np.arange(600000, 600000 + players)
+    pa = rng.integers(50, 700, players)
+    bb = (pa * rng.uniform(0.04, 0.12, players)).astype(int)
+    hbp = (pa * rng.uniform(0, 0.02, players)).astype(int)
+    sf = (pa * 0.01).astype(int)
+    ab = pa - bb - hbp - sf
+    h = (ab * rng.uniform(0.2, 0.3, players)).astype(int)
+    pd.DataFrame(
+        {
+            "playerId": ids,
+            "playerName": [f"Hitter {i}" for i in ids],
+            "position": "SS",
+            "G": pa // 4,
+            "PA": pa,
+            "AB": ab,
+            "H": h,
+            "2B": (h * 0.2).astype(int),
+            "3B": (h * 0.02).astype(int),
+            "HR": (h * rng.uniform(0, 0.2, players)).astype(int),
+            "R": (h * 0.5).astype(int),
+            "RBI": (h * 0.5).astype(int),
+            "BB": bb,
+            "SO": (pa * rng.uniform(0.1, 0.3, players)).astype(int),
+            "HBP": hbp,
+            "SF": sf,
+            "SH": 0,
+            "SB": rng.integers(0, 30, players),
+            "CS": 1,
+        }
+    ).to_csv(root / "stats" / f"{year}_bat.csv", index=False)
+
+    pa = rng.uniform(50, 650, players)
+    bb = pa * rng.uniform(0.05, 0.1, players)
+    ab = pa - bb - pa * 0.02
+    h = ab * rng.uniform(0.22, 0.28, players)
+    pd.DataFrame(
+        {
+            "xMLBAMID": ids,
+            "PA": pa,
+            "AB": ab,
+            "H": h,
+            "2B": h * 0.2,
+            "3B": h * 0.02,
+            "HR": h * rng.uniform(0.02, 0.18, players),
+            "R": h * 0.5,
+            "RBI": h * 0.5,
+            "BB": bb,
+            "SO": pa * rng.uniform(0.12, 0.28, players),
+            "HBP": pa * 0.01,
+            "SF": pa * 0.01,
+            "SH": 0.0,
+            "SB": rng.uniform(0, 20, players),
+        }
+    ).to_csv(root / "projections" / f"zips_{year}_bat.csv", index=False)
+
+
+def test_float32_rate_metrics_match_float64(tmp_path, monkeypatch):
+    write_fixture(tmp_path)
+    monkeypatch.setattr(pe, "STATS_DIR", str(tmp_path / "stats"))
+    monkeypatch.setattr(pe, "PROJECTIONS_DIR", str(tmp_path / "projections"))
+    monkeypatch.setattr(pe, "CACHE_DIR", str(tmp_path / ".cache"))
+
+    exact, _ = pe.process_year_system(2023, "ZiPS", "batting", float32_rates=False)
+    compact, merged = pe.process_year_system(2023, "ZiPS", "batting", float32_rates=True)
+
+    assert exact and len(compact) == len(exact)
+    assert (merged.dtypes == np.float32).any()
+    for expected, result in zip(exact, compact):
+        assert result.stat == expected.stat
+        assert result.n_players == expected.n_players
+        for metric in METRICS:
+            tolerance = BIAS_ABS_TOLERANCE if metric.endswith("bias") else 0
+            assert getattr(result, metric) == pytest.approx(
+                getattr(expected, metric), rel=pe.FLOAT32_RATE_TOLERANCE, abs=tolerance
+            ), (expected.stat, metric)
+
+
+def test_float32_values_are_written_rounded():
+    df = pd.DataFrame({"AVG": np.array([0.3, np.nan], dtype=np.float32), "HR": [10, 20]})
+    records = pe._stat_records(df, {"AVG": "AVG", "HR": "HR"})
+    assert records == [{"AVG": 0.3, "HR": 10}, {"AVG": None, "HR": 20}]
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "utils"))
+
+import game_logs  # noqa: E402
+
+
+def test_rows_without_a_valid_date_are_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_logs, "GAME_LOG_DIR", tmp_path)
+    df = pd.DataFrame(
+        {
+            "playerId": [1, 1, 1, 1],
+            "teamId": [111, 111, 111, 111],
+            "gamePk": [10, 11, 12, 13],
+            "date": ["2024-04-02", None, "TBD", "2024-05-01"],
+            "H": [1, 2, 3, 4],
+        }
+    )
+
+    assert game_logs.write_game_logs(df, "hitting", 2024) == 2
+
+    logs = game_logs.load_game_logs("hitting", 2024)
+    assert logs["gamePk"].tolist() == [10, 13]
+    assert game_logs.load_game_logs("hitting", 2024, through="2024-04-30")["gamePk"].tolist() == [10]
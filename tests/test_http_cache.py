@@ -0,0 +1,80 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "utils"))
+
+from http_cache import HttpCache, season_end  # noqa: E402
+
+
+class FakeServer:
+    """Records requests and answers like a server that supports ETags"""
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def fetch(self, url, headers):
+        self.requests.append(dict(headers))
+        response = requests.Response()
+        response.url = url
+        if headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+        response.headers["ETag"] = self.etag
+        return response
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_entry_cached_during_season_is_revalidated_once_season_is_over(tmp_path):
+    clock = Clock(datetime(2024, 7, 1))
+    cache = HttpCache(tmp_path, clock=clock)
+    server = FakeServer(b'{"partial": true}', '"v1"')
+    url = "https://example.test/stats?season=2024"
+
+    # A mid-season refresh caches a partial season
+    cache.get(url, server.fetch)
+    assert len(server.requests) == 1
+
+    # The season ends; the entry predates the end, so it must be revalidated
+    clock.now = datetime(2025, 2, 1)
+    server.body, server.etag = b'{"partial": false}', '"v2"'
+    response = cache.get(url, server.fetch, frozen_after=season_end(2024))
+    assert len(server.requests) == 2
+    assert server.requests[-1] == {"If-None-Match": '"v1"'}
+    assert response.content == b'{"partial": false}'
+
+    # Now fetched after the season ended, so it's served from disk
+    response = cache.get(url, server.fetch, frozen_after=season_end(2024))
+    assert len(server.requests) == 2
+    assert response.content == b'{"partial": false}'
+    assert (cache.hits, cache.revalidated, cache.misses) == (1, 0, 2)
+
+
+def test_not_modified_restamps_entry(tmp_path):
+    clock = Clock(datetime(2024, 7, 1))
+    cache = HttpCache(tmp_path, clock=clock)
+    server = FakeServer(b"final", '"v1"')
+    url = "https://example.test/stats?season=2024"
+
+    cache.get(url, server.fetch)
+    clock.now = datetime(2025, 2, 1)
+    assert cache.get(url, server.fetch, frozen_after=season_end(2024)).content == b"final"
+    assert cache.revalidated == 1
+
+    cache.get(url, server.fetch, frozen_after=season_end(2024))
+    assert len(server.requests) == 2
+    assert cache.hits == 1
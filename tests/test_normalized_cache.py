@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import projection_evaluation as pe  # noqa: E402
+
+
+def test_cache_picks_up_newly_needed_source_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(pe, "CACHE_DIR", str(tmp_path / ".cache"))
+    source = tmp_path / "stats" / "2023_bat.csv"
+    source.parent.mkdir()
+    source.write_text("playerId,HR,SB\n1,10,5\n")
+
+    def read(dtypes):
+        return pe._read_normalized(source, lambda df: df, source_dtypes=dtypes)
+
+    assert list(read({"playerId": str, "HR": "float64"}).columns) == ["playerId", "HR"]
+
+    # A newly evaluated stat needs SB, which the warm cache doesn't have
+    df = read({"playerId": str, "HR": "float64", "SB": "float64"})
+    assert df["SB"].tolist() == [5.0]
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import projection_evaluation as pe  # noqa: E402
+
+WOBA_HEADER = "Season," + ",".join(pe.WOBA_WEIGHT_COLUMNS)
+
+
+def write_woba(directory: Path, season: int, weight: float) -> None:
+    directory.mkdir()
+    values = ",".join(str(weight) for _ in pe.WOBA_WEIGHT_COLUMNS)
+    (directory / "woba.csv").write_text(f"{WOBA_HEADER}\n{season},{values}\n")
+
+
+def test_constants_follow_stats_dir(tmp_path, monkeypatch):
+    write_woba(tmp_path / "a", 2023, 0.5)
+    write_woba(tmp_path / "b", 2023, 0.7)
+
+    monkeypatch.setattr(pe, "STATS_DIR", str(tmp_path / "a"))
+    assert pe.woba_weights([2023]).iloc[0, 0] == 0.5
+
+    monkeypatch.setattr(pe, "STATS_DIR", str(tmp_path / "b"))
+    assert pe.woba_weights([2023]).iloc[0, 0] == 0.7
+
+
+def test_missing_constants_give_an_empty_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(pe, "STATS_DIR", str(tmp_path))
+    assert pe.load_woba_constants().empty
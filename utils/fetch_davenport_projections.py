@@ -8,10 +8,15 @@ from typing import Optional, List, Dict, Tuple
 import pandas as pd
 from bs4 import BeautifulSoup
 
+from http_cache import HttpCache, season_end
+
 # Define base URL and directories
 BASE_URL = "https://claydavenport.com/projections"
 PROJECTIONS_DIR = Path("projections")
 
+# Downloaded pages and files, reused across runs (see http_cache.py)
+HTTP_CACHE = HttpCache()
+
 # Define default headers for text files that might be missing them
 DEFAULT_BATTING_HEADER = [
     "IDNO", "YEAR", "MLBID", "Last", "First", "Team", "Lg", "Age", "PA", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "SO", "SB", "CS", "TRND", "HBP", "BA", "OBP", "SLG", "EqBA", "EqOBP", "EqSLG", "EqA", "VORP", "WARP", "Defense", "FRAA", "MJ", "BRK", "IMP", "COL", "ATT", "DRP", "UPS", "COMP1", "COMP2", "COMP3", "COMP4", "CPW", "CSP", "CSO", "CBB", "CBA", "EQR"
@@ -22,10 +27,14 @@ DEFAULT_PITCHING_HEADER = [
 ]
 
 
-def download_file(url: str, output_path: Path, is_space_delimited_txt: bool = False, player_type: Optional[str] = None):
+def _get(url: str, headers: Dict[str, str]) -> requests.Response:
+    return requests.get(url, headers=headers)
+
+
+def download_file(url: str, output_path: Path, is_space_delimited_txt: bool = False, player_type: Optional[str] = None, frozen_after: Optional[datetime] = None):
     """Downloads a file, converts to CSV, standardizes header, and adds header if missing."""
     try:
-        response = requests.get(url)
+        response = HTTP_CACHE.get(url, _get, frozen_after=frozen_after)
         response.raise_for_status()  # Raise an exception for 4xx/5xx status codes
 
         # Ensure the output directory exists
@@ -35,6 +44,8 @@ def download_file(url: str, output_path: Path, is_space_delimited_txt: bool = Fa
 
         if not text_content.strip():
             # If the file is empty or just whitespace, create an empty file and return.
+            # Don't keep the empty response, so the next run downloads it again.
+            HTTP_CACHE.evict(url)
             output_path.touch()
             print(f"Downloaded empty file: {output_path.name}")
             return True
@@ -149,16 +160,16 @@ def download_mlb_projections():
         secondary_hitter_url = f"{BASE_URL}/{year}/clayhitters.{year}.csv"
 
         # Try primary URL first, if it fails with a 404, try the secondary one
-        if not download_file(primary_hitter_url, hitter_output):
-            download_file(secondary_hitter_url, hitter_output)
+        if not download_file(primary_hitter_url, hitter_output, frozen_after=season_end(year)):
+            download_file(secondary_hitter_url, hitter_output, frozen_after=season_end(year))
 
         # Pitching (assuming similar naming convention and inconsistency)
         pitcher_output = PROJECTIONS_DIR / f"davenport_mlb_{year}_pit.csv"
         primary_pitcher_url = f"{BASE_URL}/{year}/claypitchers.csv"
         secondary_pitcher_url = f"{BASE_URL}/{year}/claypitchers.{year}.csv"
 
-        if not download_file(primary_pitcher_url, pitcher_output):
-            download_file(secondary_pitcher_url, pitcher_output)
+        if not download_file(primary_pitcher_url, pitcher_output, frozen_after=season_end(year)):
+            download_file(secondary_pitcher_url, pitcher_output, frozen_after=season_end(year))
 
 
 def download_full_projections():
@@ -177,12 +188,12 @@ def download_full_projections():
         # Based on user request, inferring hitter file name and output format
         hitter_url = f"{BASE_URL}/{year}/hitter_projections.txt"
         hitter_output = PROJECTIONS_DIR / f"davenport_full_{year}_bat.csv"
-        download_file(hitter_url, hitter_output, is_space_delimited_txt=True, player_type="batting")
+        download_file(hitter_url, hitter_output, is_space_delimited_txt=True, player_type="batting", frozen_after=season_end(year))
 
         # Pitching
         pitcher_url = f"{BASE_URL}/{year}/pitcher_projections.txt"
         pitcher_output = PROJECTIONS_DIR / f"davenport_full_{year}_pit.csv"
-        download_file(pitcher_url, pitcher_output, is_space_delimited_txt=True, player_type="pitching")
+        download_file(pitcher_url, pitcher_output, is_space_delimited_txt=True, player_type="pitching", frozen_after=season_end(year))
 
 
 def build_howeid_to_mlbid_map():
@@ -337,7 +348,7 @@ def get_team_abbreviations(year: int) -> List[str]:
     """
     try:
         url = f"https://claydavenport.com/projections/{year}/"
-        response = requests.get(url)
+        response = HTTP_CACHE.get(url, _get, frozen_after=season_end(year))
         response.raise_for_status()
 
         # Use regex to find all links that match the pattern: 3 letters followed by .shtml
@@ -351,6 +362,8 @@ def get_team_abbreviations(year: int) -> List[str]:
 
         # Remove duplicates and sort
         team_abbreviations = sorted(list(set(team_links)))
+        if not team_abbreviations:
+            HTTP_CACHE.evict(url)
 
         # Skip OAK for 2025 (they have both ATH and OAK)
         if year == 2025 and "OAK" in team_abbreviations:
@@ -377,7 +390,7 @@ def scrape_team_page(year: int, team_abbr: str) -> Tuple[List[List[str]], List[L
     """
     try:
         url = f"https://claydavenport.com/projections/{year}/{team_abbr}.shtml"
-        response = requests.get(url)
+        response = HTTP_CACHE.get(url, _get, frozen_after=season_end(year))
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -390,6 +403,8 @@ def scrape_team_page(year: int, team_abbr: str) -> Tuple[List[List[str]], List[L
 
         # Check if we have enough tables
         if len(tables) < 3:
+            # Likely a truncated page; drop it so it's fetched again next run
+            HTTP_CACHE.evict(url)
             print(f"  {team_abbr}: Not enough tables found ({len(tables)}), skipping...")
             return [], []
 
@@ -1128,4 +1143,5 @@ if __name__ == "__main__":
     id_map = build_howeid_to_mlbid_map()
     add_mlbid_to_combined_projections(id_map)
 
+    print(HTTP_CACHE.summary())
     print("\nDownload process complete.")
\ No newline at end of file
@@ -1,158 +1,359 @@
+import argparse
+import io
+import json
 import requests
 import pandas as pd
 import os
+import random
+import threading
 import time
-from typing import Dict, List, Any, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Set, Sized, Tuple
+
+from requests.adapters import HTTPAdapter
+
+from game_logs import GAME_LOG_DIR, aggregate_game_logs, write_game_logs
+from http_cache import HttpCache, current_season, season_end
+
+# Point MLB_STATS_API_URL at a local server to replay recorded responses
+BASE_URL = os.environ.get("MLB_STATS_API_URL", "https://statsapi.mlb.com/api/v1")
+
+# Concurrent requests, and the request rate (with bursts) they share
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 2.0
+BURST = 4
+
+# Seasons fetched by a full rebuild
+FIRST_SEASON = 2007
+LAST_SEASON = 2024
+
+# Rows in a season CSV are unique per player and team
+STATS_KEY = ["playerId", "teamId"]
+
+BIO_FILE = "stats/player_bio.csv"
+
+# Retries for 429 and 5xx responses and connection errors, with jittered exponential backoff
+MAX_RETRIES = 5
+BACKOFF_SECONDS = 1.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may be sent
+
+    clock and sleep default to time.monotonic and time.sleep.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Shared session, so requests reuse pooled keep-alive connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_http_cache() -> HttpCache:
+    return HttpCache()
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> TokenBucket:
+    return TokenBucket(REQUESTS_PER_SECOND, BURST)
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    if response is not None and response.headers.get("Retry-After", "").isdigit():
+        return float(response.headers["Retry-After"])
+    return BACKOFF_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _get_with_retries(url: str, headers: Dict[str, str]) -> requests.Response:
+    """GET through the shared session and rate limiter, retrying transient failures"""
+    for attempt in range(MAX_RETRIES + 1):
+        get_rate_limiter().acquire()
+        try:
+            response = get_session().get(url, headers=headers, timeout=30)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(_retry_delay(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            time.sleep(_retry_delay(attempt, response))
+            continue
+        response.raise_for_status()
+        return response
 
 
-def get_mlb_stats(season: int, group: str) -> List[Dict[str, Any]]:
+def fetch_body(url: str, frozen_after: Optional[datetime] = None) -> bytes:
+    """GET a response body, from the response cache if it was fetched after frozen_after and otherwise revalidated"""
+    return get_http_cache().get(url, _get_with_retries, frozen_after=frozen_after).content
 
-    url = f"https://statsapi.mlb.com/api/v1/stats?stats=season&season={season}&group={group}&playerPool=ALL&limit=5000"
 
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+def fetch_parsed(
+    url: str, parse: Callable[[bytes], Any], frozen_after: Optional[datetime] = None
+) -> Any:
+    """parse(body) for a fetched body, evicting it from the response cache if it raises ValueError
 
-        if "stats" in data and len(data["stats"]) > 0:
-            return data["stats"][0].get("splits", [])
-        else:
-            print(f"No stats found for {season} {group}")
-            return []
+    A truncated or otherwise malformed body is then fetched again next time
+    instead of being served from disk.
+    """
+    body = fetch_body(url, frozen_after=frozen_after)
+    try:
+        return parse(body)
+    except ValueError:
+        get_http_cache().evict(url)
+        raise
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data for {season} {group}: {e}")
-        return []
 
+def fetch_json(url: str, frozen_after: Optional[datetime] = None) -> Dict[str, Any]:
+    return fetch_parsed(url, json.loads, frozen_after=frozen_after)
 
-def extract_counting_stats_pitching(
-    splits: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
 
-    records = []
+@lru_cache(maxsize=None)
+def _ijson():
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
 
-    counting_stats_map = {
-        "gamesPlayed": "G",
-        "gamesStarted": "GS",
-        "gamesFinished": "GF",
-        "wins": "W",
-        "losses": "L",
-        "saves": "SV",
-        "saveOpportunities": "SVO",
-        "holds": "HLD",
-        "blownSaves": "BS",
-        "gamesPitched": "GP",
-        "completeGames": "CG",
-        "shutouts": "SHO",
-        "inningsPitched": "IP",
-        "hits": "H",
-        "runs": "R",
-        "earnedRuns": "ER",
-        "homeRuns": "HR",
-        "baseOnBalls": "BB",
-        "intentionalWalks": "IBB",
-        "strikeOuts": "SO",
-        "hitBatsmen": "HBP",
-        "balks": "BK",
-        "wildPitches": "WP",
-        "pickoffs": "PO",
-        "battersFaced": "BF",
-        "outs": "OUTS",
-        "doubles": "2B",
-        "triples": "3B",
-        "sacBunts": "SH",
-        "sacFlies": "SF",
-        "groundOuts": "GO",
-        "airOuts": "PO",
-        "numberOfPitches": "PITCHES",
-        "strikes": "STRIKES",
-        "inheritedRunners": "IR",
-        "inheritedRunnersScored": "IRS",
-        "atBats": "AB",
-        "stolenBases": "SB",
-        "caughtStealing": "CS",
-        "groundIntoDoublePlay": "GIDP",
-        "catchersInterference": "CI",
-        "totalBases": "TB",
-    }
 
-    for split in splits:
-        if "player" in split and "stat" in split:
-            record = {
-                "playerId": split["player"].get("id"),
-                "playerName": split["player"].get("fullName"),
-                "firstName": split["player"].get("firstName"),
-                "lastName": split["player"].get("lastName"),
-                "teamId": split.get("team", {}).get("id"),
-                "teamName": split.get("team", {}).get("name"),
-                "season": split.get("season"),
-                "league": split.get("league", {}).get("name"),
-                "position": split.get("position", {}).get("abbreviation"),
-            }
+def iter_splits(body: bytes) -> Iterator[Dict[str, Any]]:
+    """Splits in a stats response
 
-            # Add counting stats with standard abbreviations
-            for api_stat, abbrev in counting_stats_map.items():
-                record[abbrev] = split["stat"].get(api_stat, 0)
+    With ijson installed the body is parsed incrementally, one split at a time,
+    instead of being loaded as a whole. Season and game log queries return a
+    single stats block.
+    """
+    ijson = _ijson()
+    if ijson is not None:
+        return _ijson_splits(ijson, body)
 
-            records.append(record)
+    stats = json.loads(body).get("stats") or [{}]
+    return iter(stats[0].get("splits", []))
 
-    return records
 
+def _ijson_splits(ijson, body: bytes) -> Iterator[Dict[str, Any]]:
+    # Malformed bodies raise ValueError, as json.loads does, so callers handle both parsers alike
+    try:
+        yield from ijson.items(io.BytesIO(body), "stats.item.splits.item", use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
 
-def extract_counting_stats_hitting(
-    splits: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
 
-    records = []
+def get_mlb_stats(season: int, group: str) -> Dict[str, List[Any]]:
+    """Season stats for a group as columns (see extract_counting_stats)"""
 
-    counting_stats_map = {
-        "gamesPlayed": "G",
-        "atBats": "AB",
-        "runs": "R",
-        "hits": "H",
-        "doubles": "2B",
-        "triples": "3B",
-        "homeRuns": "HR",
-        "rbi": "RBI",
-        "baseOnBalls": "BB",
-        "intentionalWalks": "IBB",
-        "strikeOuts": "SO",
-        "stolenBases": "SB",
-        "caughtStealing": "CS",
-        "hitByPitch": "HBP",
-        "sacBunts": "SH",
-        "sacFlies": "SF",
-        "groundOuts": "GO",
-        "airOuts": "FO",
-        "groundIntoDoublePlay": "GIDP",
-        "plateAppearances": "PA",
-        "totalBases": "TB",
-        "leftOnBase": "LOB",
-        "pickoffs": "PO",
-        "catchersInterference": "CI",
-    }
+    url = f"{BASE_URL}/stats?stats=season&season={season}&group={group}&playerPool=ALL&limit=5000"
 
-    for split in splits:
-        if "player" in split and "stat" in split:
-            record = {
-                "playerId": split["player"].get("id"),
-                "playerName": split["player"].get("fullName"),
-                "firstName": split["player"].get("firstName"),
-                "lastName": split["player"].get("lastName"),
-                "teamId": split.get("team", {}).get("id"),
-                "teamName": split.get("team", {}).get("name"),
-                "season": split.get("season"),
-                "league": split.get("league", {}).get("name"),
-                "position": split.get("position", {}).get("abbreviation"),
-            }
+    try:
+        # Completed seasons come from the cache once downloaded after they ended
+        columns = fetch_parsed(
+            url,
+            lambda body: extract_counting_stats(iter_splits(body), group),
+            frozen_after=season_end(season),
+        )
 
-            # Add counting stats with standard abbreviations
-            for api_stat, abbrev in counting_stats_map.items():
-                record[abbrev] = split["stat"].get(api_stat, 0)
+        if not columns["playerId"]:
+            print(f"No stats found for {season} {group}")
+            return {}
+        return columns
 
-            records.append(record)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error fetching data for {season} {group}: {e}")
+        return {}
+
+
+# API stat name -> column abbreviation for each stats group
+PITCHING_STATS_MAP: Dict[str, str] = {
+    "gamesPlayed": "G",
+    "gamesStarted": "GS",
+    "gamesFinished": "GF",
+    "wins": "W",
+    "losses": "L",
+    "saves": "SV",
+    "saveOpportunities": "SVO",
+    "holds": "HLD",
+    "blownSaves": "BS",
+    "gamesPitched": "GP",
+    "completeGames": "CG",
+    "shutouts": "SHO",
+    "inningsPitched": "IP",
+    "hits": "H",
+    "runs": "R",
+    "earnedRuns": "ER",
+    "homeRuns": "HR",
+    "baseOnBalls": "BB",
+    "intentionalWalks": "IBB",
+    "strikeOuts": "SO",
+    "hitBatsmen": "HBP",
+    "balks": "BK",
+    "wildPitches": "WP",
+    "pickoffs": "PO",
+    "battersFaced": "BF",
+    "outs": "OUTS",
+    "doubles": "2B",
+    "triples": "3B",
+    "sacBunts": "SH",
+    "sacFlies": "SF",
+    "groundOuts": "GO",
+    "airOuts": "PO",
+    "numberOfPitches": "PITCHES",
+    "strikes": "STRIKES",
+    "inheritedRunners": "IR",
+    "inheritedRunnersScored": "IRS",
+    "atBats": "AB",
+    "stolenBases": "SB",
+    "caughtStealing": "CS",
+    "groundIntoDoublePlay": "GIDP",
+    "catchersInterference": "CI",
+    "totalBases": "TB",
+}
+
+HITTING_STATS_MAP: Dict[str, str] = {
+    "gamesPlayed": "G",
+    "atBats": "AB",
+    "runs": "R",
+    "hits": "H",
+    "doubles": "2B",
+    "triples": "3B",
+    "homeRuns": "HR",
+    "rbi": "RBI",
+    "baseOnBalls": "BB",
+    "intentionalWalks": "IBB",
+    "strikeOuts": "SO",
+    "stolenBases": "SB",
+    "caughtStealing": "CS",
+    "hitByPitch": "HBP",
+    "sacBunts": "SH",
+    "sacFlies": "SF",
+    "groundOuts": "GO",
+    "airOuts": "FO",
+    "groundIntoDoublePlay": "GIDP",
+    "plateAppearances": "PA",
+    "totalBases": "TB",
+    "leftOnBase": "LOB",
+    "pickoffs": "PO",
+    "catchersInterference": "CI",
+}
+
+# Player, team and context columns, taken from (section of the split, key); None is the split itself
+SPLIT_FIELDS: Dict[str, Tuple[Optional[str], str]] = {
+    "playerId": ("player", "id"),
+    "playerName": ("player", "fullName"),
+    "firstName": ("player", "firstName"),
+    "lastName": ("player", "lastName"),
+    "teamId": ("team", "id"),
+    "teamName": ("team", "name"),
+    "season": (None, "season"),
+    "league": ("league", "name"),
+    "position": ("position", "abbreviation"),
+}
+
+# Game log splits also identify the game
+GAME_LOG_FIELDS: Dict[str, Tuple[Optional[str], str]] = {
+    **SPLIT_FIELDS,
+    "date": (None, "date"),
+    "gamePk": ("game", "gamePk"),
+    "opponentId": ("opponent", "id"),
+    "isHome": (None, "isHome"),
+}
+
+# Rows allocated at a time when the number of splits isn't known up front
+EXTRACT_BLOCK_SIZE = 1024
+
+
+def stat_columns(group: str) -> Dict[str, str]:
+    """Column abbreviation -> API stat name, in column order
+
+    When two API stats share an abbreviation (pickoffs and airOuts are both PO
+    for pitchers), the column keeps the first one's position and the last
+    one's value.
+    """
+    stats_map = PITCHING_STATS_MAP if group == "pitching" else HITTING_STATS_MAP
+    columns: Dict[str, str] = {}
+    for api_stat, abbrev in stats_map.items():
+        columns[abbrev] = api_stat
+    return columns
+
+
+def extract_counting_stats(
+    splits: Iterable[Dict[str, Any]],
+    group: str,
+    fields: Dict[str, Tuple[Optional[str], str]] = SPLIT_FIELDS,
+) -> Dict[str, List[Any]]:
+    """Split fields and counting stats as one list per column
+
+    Fills preallocated column lists in a single pass rather than building a
+    dict per player. splits can be a list or a stream (see iter_splits); a
+    stream's columns grow a block of rows at a time.
+    """
+    stats = stat_columns(group)
+    capacity = len(splits) if isinstance(splits, Sized) else EXTRACT_BLOCK_SIZE
+    columns: Dict[str, List[Any]] = {
+        name: [None] * capacity for name in [*fields, *stats]
+    }
+    field_getters = [
+        (columns[name], section, key) for name, (section, key) in fields.items()
+    ]
+    stat_getters = [(columns[abbrev], api_stat) for abbrev, api_stat in stats.items()]
 
-    return records
+    row = 0
+    for split in splits:
+        if "player" not in split or "stat" not in split:
+            continue
+        if row == capacity:
+            for column in columns.values():
+                column.extend([None] * EXTRACT_BLOCK_SIZE)
+            capacity += EXTRACT_BLOCK_SIZE
+
+        for column, section, key in field_getters:
+            source = split if section is None else split.get(section, {})
+            column[row] = source.get(key)
+        stat = split["stat"]
+        for column, api_stat in stat_getters:
+            column[row] = stat.get(api_stat, 0)
+        row += 1
+
+    for column in columns.values():
+        del column[row:]
+    return columns
 
 
 def get_player_bio_data(player_ids: List[int]) -> List[Dict[str, Any]]:
@@ -162,12 +363,11 @@ def get_player_bio_data(player_ids: List[int]) -> List[Dict[str, Any]]:
 
     # Convert player IDs to comma-separated string
     ids_str = ",".join(map(str, player_ids))
-    url = f"https://statsapi.mlb.com/api/v1/people?personIds={ids_str}"
+    url = f"{BASE_URL}/people?personIds={ids_str}"
 
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        # Birthdates and handedness don't change, so a cached batch is reused as is
+        data = fetch_json(url, frozen_after=datetime.min)
 
         if "people" in data:
             return data["people"]
@@ -175,7 +375,8 @@ def get_player_bio_data(player_ids: List[int]) -> List[Dict[str, Any]]:
             print(f"No people data found for player IDs: {ids_str}")
             return []
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError covers a malformed body (json.JSONDecodeError)
         print(f"Error fetching bio data for player IDs {ids_str}: {e}")
         return []
 
@@ -203,7 +404,15 @@ def extract_player_bio_records(
     return records
 
 
-def fetch_all_player_bios(unique_player_ids: Set[int]) -> None:
+def known_bio_ids() -> Set[int]:
+    """Player IDs already in the bio file"""
+    if not os.path.exists(BIO_FILE):
+        return set()
+    return set(pd.read_csv(BIO_FILE, usecols=["playerId"])["playerId"].dropna().astype(int))
+
+
+def fetch_all_player_bios(unique_player_ids: Set[int], append: bool = False) -> None:
+    """Fetch bios for the given players, appending to the bio file rather than rewriting it if requested"""
 
     print(
         f"\nFetching biographical data for {len(unique_player_ids)} unique players..."
@@ -211,99 +420,206 @@ def fetch_all_player_bios(unique_player_ids: Set[int]) -> None:
 
     os.makedirs("csv", exist_ok=True)
 
-    player_ids_list = list(unique_player_ids)
+    # Sorted so batch URLs are stable from run to run and hit the response cache
+    player_ids_list = sorted(unique_player_ids)
     all_bio_records = []
 
     batch_size = 100
-    total_batches = (len(player_ids_list) + batch_size - 1) // batch_size
+    batches = [
+        player_ids_list[i : i + batch_size]
+        for i in range(0, len(player_ids_list), batch_size)
+    ]
+
+    # Batches are fetched concurrently but combined in batch order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for batch_num, (batch_ids, bio_data) in enumerate(
+            zip(batches, executor.map(get_player_bio_data, batches)), start=1
+        ):
+            print(
+                f"  Processed batch {batch_num}/{len(batches)} ({len(batch_ids)} players)..."
+            )
+            if bio_data:
+                bio_records = extract_player_bio_records(bio_data)
+                all_bio_records.extend(bio_records)
+                print(f"    Retrieved {len(bio_records)} player bio records")
+
+    if not all_bio_records:
+        print("\nNo biographical data retrieved")
+        return
+
+    df_bio = pd.DataFrame(all_bio_records)
+    if append and os.path.exists(BIO_FILE):
+        # Match the existing file's column order, since no header is written
+        columns = pd.read_csv(BIO_FILE, nrows=0).columns
+        df_bio.reindex(columns=columns).to_csv(BIO_FILE, mode="a", header=False, index=False)
+        print(f"\nAppended {len(all_bio_records)} player bio records to {BIO_FILE}")
+    else:
+        df_bio.to_csv(BIO_FILE, index=False)
+        print(f"\nSaved {len(all_bio_records)} player bio records to {BIO_FILE}")
+
+
+def merge_season_stats(stats_file: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Fresh rows replace existing rows for the same player and team; other existing rows are kept"""
+    if not os.path.exists(stats_file):
+        return df
+    existing = pd.read_csv(stats_file)
+    return pd.concat([df, existing], ignore_index=True).drop_duplicates(
+        subset=STATS_KEY, keep="first"
+    )
+
+
+def save_season_stats(
+    year: int, group: str, columns: Dict[str, List[Any]], merge: bool = False
+) -> Set[int]:
+    """Write one season's stats CSV, merging into an existing one if requested, and return the player IDs in it"""
+    stats_file = stats_file_path(year, group)
+
+    if not columns.get("playerId"):
+        print(f"    No {group} records found for {year}")
+        return set()
 
-    for i in range(0, len(player_ids_list), batch_size):
-        batch_num = (i // batch_size) + 1
-        batch_ids = player_ids_list[i : i + batch_size]
+    df = pd.DataFrame(columns)
+    n_records = len(df)
+    if merge:
+        df = merge_season_stats(stats_file, df)
+    df.to_csv(stats_file, index=False)
+    print(f"    Saved {n_records} {group} records to {stats_file}")
+    return {player_id for player_id in columns["playerId"] if player_id}
 
-        print(
-            f"  Processing batch {batch_num}/{total_batches} ({len(batch_ids)} players)..."
+
+def stats_file_path(year: int, group: str) -> str:
+    return f"stats/{year}_pit.csv" if group == "pitching" else f"stats/{year}_bat.csv"
+
+
+def get_game_logs(player_id: int, season: int, group: str) -> Dict[str, List[Any]]:
+    """One player's per-game stats for a season as columns"""
+
+    url = f"{BASE_URL}/people/{player_id}/stats?stats=gameLog&season={season}&group={group}"
+
+    try:
+        return fetch_parsed(
+            url,
+            lambda body: extract_counting_stats(iter_splits(body), group, fields=GAME_LOG_FIELDS),
+            frozen_after=season_end(season),
         )
 
-        bio_data = get_player_bio_data(batch_ids)
-        if bio_data:
-            bio_records = extract_player_bio_records(bio_data)
-            all_bio_records.extend(bio_records)
-            print(f"    Retrieved {len(bio_records)} player bio records")
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error fetching {group} game logs for player {player_id} in {season}: {e}")
+        return {}
 
-        # Be respectful to the API
-        time.sleep(1)
 
-    if all_bio_records:
-        df_bio = pd.DataFrame(all_bio_records)
-        bio_file = "stats/player_bio.csv"
-        df_bio.to_csv(bio_file, index=False)
-        print(f"\nSaved {len(all_bio_records)} player bio records to {bio_file}")
-    else:
-        print("\nNo biographical data retrieved")
+def fetch_season_game_logs(season: int, group: str) -> None:
+    """Fetch game logs for everyone in a season's stats file and store them by month"""
+    stats_file = stats_file_path(season, group)
+    if not os.path.exists(stats_file):
+        print(f"  No {stats_file}, so no players to fetch {group} game logs for")
+        return
 
+    player_ids = (
+        pd.read_csv(stats_file, usecols=["playerId"])["playerId"].dropna().astype(int).unique()
+    )
 
-def main():
+    # Per-player columns are concatenated column by column into one frame per season
+    logs: Dict[str, List[Any]] = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for columns in executor.map(
+            lambda player_id: get_game_logs(player_id, season, group), player_ids
+        ):
+            for name, values in columns.items():
+                logs.setdefault(name, []).extend(values)
+
+    df = pd.DataFrame(logs)
+    written = write_game_logs(df, group, season)
+    print(
+        f"  {season} {group}: {len(df)} game logs for {len(player_ids)} players, "
+        f"{written} monthly partitions updated"
+    )
 
-    os.makedirs("stats", exist_ok=True)
+    totals = aggregate_game_logs(group, season)
+    if not totals.empty:
+        totals_file = GAME_LOG_DIR / Path(stats_file).name
+        totals.to_csv(totals_file, index=False)
+        print(f"    Saved season totals from game logs to {totals_file}")
 
-    unique_player_ids: Set[int] = set()
 
-    years = range(2007, 2025)
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch season stats and player bios from the MLB Stats API")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="merge into existing stats CSVs and only fetch bios for new players "
+        "(seasons default to the current one)",
+    )
+    parser.add_argument(
+        "--game-logs",
+        action="store_true",
+        help="fetch per-game stats for the players in each season's stats files, "
+        "store them by month in stats/game_logs and rebuild season totals from them",
+    )
+    parser.add_argument("--start", type=int, help="first season to fetch")
+    parser.add_argument("--end", type=int, help="last season to fetch, inclusive "
+        "(incremental runs default to the current season)")
+    args = parser.parse_args(argv)
 
-    for year in years:
-        print(f"Fetching data for {year}...")
+    default_start, default_end = (
+        (current_season(), current_season()) if args.incremental else (FIRST_SEASON, LAST_SEASON)
+    )
+    if args.start is None:
+        args.start = default_start
+    if args.end is None:
+        args.end = max(args.start, default_end)
+    if args.start > args.end:
+        parser.error(f"--start {args.start} is after --end {args.end}")
+    return args
 
-        print(f"  Fetching pitching stats for {year}...")
-        pitching_splits = get_mlb_stats(year, "pitching")
 
-        if pitching_splits:
-            pitching_records = extract_counting_stats_pitching(pitching_splits)
-            if pitching_records:
-                # Collect unique player IDs
-                for record in pitching_records:
-                    if record.get("playerId"):
-                        unique_player_ids.add(record["playerId"])
+def main(argv: Optional[List[str]] = None):
 
-                df_pitching = pd.DataFrame(pitching_records)
-                pitching_file = f"stats/{year}_pit.csv"
-                df_pitching.to_csv(pitching_file, index=False)
-                print(
-                    f"    Saved {len(pitching_records)} pitching records to {pitching_file}"
-                )
-            else:
-                print(f"    No pitching records found for {year}")
-
-        print(f"  Fetching hitting stats for {year}...")
-        hitting_splits = get_mlb_stats(year, "hitting")
-
-        if hitting_splits:
-            hitting_records = extract_counting_stats_hitting(hitting_splits)
-            if hitting_records:
-                # Collect unique player IDs
-                for record in hitting_records:
-                    if record.get("playerId"):
-                        unique_player_ids.add(record["playerId"])
-
-                df_hitting = pd.DataFrame(hitting_records)
-                hitting_file = f"stats/{year}_bat.csv"
-                df_hitting.to_csv(hitting_file, index=False)
-                print(
-                    f"    Saved {len(hitting_records)} hitting records to {hitting_file}"
-                )
-            else:
-                print(f"    No hitting records found for {year}")
+    args = parse_args(argv)
 
-        # Be respectful to the API
-        time.sleep(1)
+    os.makedirs("stats", exist_ok=True)
+
+    if args.game_logs:
+        for year in range(args.start, args.end + 1):
+            for group in ("pitching", "hitting"):
+                fetch_season_game_logs(year, group)
+        print(get_http_cache().summary())
+        return
+
+    unique_player_ids: Set[int] = set()
+
+    years = range(args.start, args.end + 1)
+
+    # Fetch every season/group concurrently and write each CSV as soon as it arrives
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_mlb_stats, year, group): (year, group)
+            for year in years
+            for group in ("pitching", "hitting")
+        }
+        for future in as_completed(futures):
+            year, group = futures[future]
+            print(f"  Fetched {group} stats for {year}")
+            columns = future.result()
+            if columns:
+                unique_player_ids |= save_season_stats(
+                    year, group, columns, merge=args.incremental
+                )
 
     print("Data fetching complete!")
 
+    if args.incremental:
+        unique_player_ids -= known_bio_ids()
+
     if unique_player_ids:
-        fetch_all_player_bios(unique_player_ids)
+        fetch_all_player_bios(unique_player_ids, append=args.incremental)
+    elif args.incremental:
+        print("No new players, so no biographical data to fetch")
     else:
         print("No unique player IDs found to fetch biographical data")
 
+    print(get_http_cache().summary())
+
 
 if __name__ == "__main__":
     main()
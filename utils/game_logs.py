@@ -0,0 +1,150 @@
+"""Per-game stats storage, partitioned by season and month, and aggregation back to season totals"""
+
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from innings import convert_outs_to_ip
+
+GAME_LOG_DIR = Path("stats") / "game_logs"
+
+# Columns describing the player and team, which aren't summed into season totals
+ID_COLUMNS = [
+    "playerId",
+    "playerName",
+    "firstName",
+    "lastName",
+    "teamId",
+    "teamName",
+    "season",
+    "league",
+    "position",
+]
+
+# Columns describing the game itself, which are dropped from season totals
+GAME_COLUMNS = ["date", "gamePk", "opponentId", "isHome"]
+
+# A player's line in one game (doubleheaders have separate gamePks)
+GAME_KEY = ["playerId", "teamId", "gamePk"]
+
+# Season totals have one row per player and team
+SEASON_KEY = ["playerId", "teamId"]
+
+
+@lru_cache(maxsize=None)
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("Note: pyarrow is not installed, so game logs are stored as CSV")
+        return False
+    return True
+
+
+def _extension() -> str:
+    return "parquet" if _parquet_available() else "csv"
+
+
+def season_dir(group: str, season: int) -> Path:
+    return GAME_LOG_DIR / group / str(season)
+
+
+def partition_path(group: str, season: int, month: int) -> Path:
+    return season_dir(group, season) / f"{month:02d}.{_extension()}"
+
+
+def read_partition(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+def _serialize(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    if _parquet_available():
+        df.to_parquet(buffer, index=False)
+    else:
+        df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+def write_game_logs(df: pd.DataFrame, group: str, season: int) -> int:
+    """Merge a season's game logs into its monthly partitions and return how many partitions changed
+
+    Fresh rows replace stored rows for the same player, team and game; stored
+    rows for players that weren't fetched are kept. Rows without a YYYY-MM-DD
+    date are skipped. Partitions whose contents come out unchanged aren't
+    rewritten.
+    """
+    if df.empty:
+        return 0
+
+    # Partitions are picked by month, so rows without a usable date can't be stored
+    dates = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
+    undated = dates.isna()
+    if undated.any():
+        print(
+            f"Warning: skipping {undated.sum()} {season} {group} game log rows "
+            "with a missing or malformed date"
+        )
+        df, dates = df[~undated], dates[~undated]
+
+    written = 0
+    for month, fresh in df.groupby(dates.dt.month, sort=True):
+        path = partition_path(group, season, month)
+        if path.exists():
+            fresh = pd.concat([fresh, read_partition(path)], ignore_index=True)
+            fresh = fresh.drop_duplicates(subset=GAME_KEY, keep="first")
+        fresh = fresh.sort_values(["date", "gamePk", "playerId"], kind="stable")
+
+        data = _serialize(fresh.reset_index(drop=True))
+        if path.exists() and path.read_bytes() == data:
+            continue
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        written += 1
+
+    return written
+
+
+def load_game_logs(group: str, season: int, through: Optional[str] = None) -> pd.DataFrame:
+    """Stored game logs for a season, optionally only games on or before a date (YYYY-MM-DD)"""
+    paths = sorted(season_dir(group, season).glob(f"*.{_extension()}"))
+    if through is not None:
+        paths = [p for p in paths if p.stem <= through[5:7]]
+    if not paths:
+        return pd.DataFrame()
+
+    logs = pd.concat([read_partition(p) for p in paths], ignore_index=True)
+    if through is not None:
+        logs = logs[logs["date"] <= through]
+    return logs
+
+
+def aggregate_game_logs(group: str, season: int, through: Optional[str] = None) -> pd.DataFrame:
+    """Season totals per player and team in the same columns as the season stats files
+
+    Counting stats are summed. Innings pitched are summed as outs and converted
+    back to innings notation, since IP itself doesn't add up (5.2 + 1.1 is 7.0).
+    """
+    logs = load_game_logs(group, season, through)
+    if logs.empty:
+        return logs
+
+    stat_cols = [c for c in logs.columns if c not in ID_COLUMNS and c not in GAME_COLUMNS]
+    id_cols = [c for c in ID_COLUMNS if c in logs.columns]
+    aggregations = {
+        **{c: "first" for c in id_cols if c not in SEASON_KEY},
+        **{c: "sum" for c in stat_cols if c != "IP"},
+    }
+
+    totals = logs.groupby(SEASON_KEY, sort=False, dropna=False).agg(aggregations).reset_index()
+    if "IP" in stat_cols:
+        totals["IP"] = convert_outs_to_ip(totals["OUTS"])
+    return totals[id_cols + stat_cols]
@@ -0,0 +1,152 @@
+"""On-disk HTTP response cache shared by the fetch scripts.
+
+Responses are stored by URL along with their ETag/Last-Modified validators
+and when they were fetched. A URL can be frozen from a point in time (e.g. the
+end of a season, after which its stats no longer change): entries fetched
+after that are served straight from disk. Anything else, including an entry
+cached while the season was still being played, is revalidated with a
+conditional request, and a 304 Not Modified reuses the stored body.
+
+Any 200 is stored as it arrives, so callers evict() an entry whose body turns
+out not to parse; otherwise a truncated body fetched after the season would be
+served from disk for good.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = Path(".cache") / "http"
+
+# Response headers kept alongside the body
+STORED_HEADERS = ["ETag", "Last-Modified", "Content-Type"]
+
+
+def current_season() -> int:
+    return datetime.now().year
+
+
+def season_end(season: int) -> datetime:
+    """When a season's data is final; responses fetched after it can be frozen"""
+    return datetime(season + 1, 1, 1)
+
+
+class HttpCache:
+    """URL-keyed response cache with hit/miss counters
+
+    fetch(url, headers) performs the actual request, so callers keep their own
+    session, rate limiting and retries. clock supplies the current time.
+    """
+
+    def __init__(
+        self, directory: Path = DEFAULT_CACHE_DIR, clock: Callable[[], datetime] = datetime.now
+    ):
+        self.directory = Path(directory)
+        self.clock = clock
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _load(self, url: str) -> Tuple[Optional[requests.Response], Optional[datetime]]:
+        """Cached response for url and when it was fetched"""
+        body_path, meta_path = self._paths(url)
+        if not (body_path.exists() and meta_path.exists()):
+            return None, None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response._content = body_path.read_bytes()
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        fetched_at = meta.get("fetched_at")
+        return response, datetime.fromisoformat(fetched_at) if fetched_at else None
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, url: str, response: requests.Response, body: bool = True) -> None:
+        """Save response and stamp it with the current time (body=False only restamps the metadata)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "headers": {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+            "fetched_at": self.clock().isoformat(),
+        }
+        if body:
+            self._write(body_path, response.content)
+        self._write(meta_path, json.dumps(meta).encode())
+
+    def evict(self, url: str) -> None:
+        """Drop the cached entry for url, e.g. because its body didn't parse"""
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+    def get(
+        self,
+        url: str,
+        fetch: Callable[[str, Dict[str, str]], requests.Response],
+        frozen_after: Optional[datetime] = None,
+    ) -> requests.Response:
+        """Response for url, from disk if frozen and otherwise via (conditional) fetch
+
+        The cached entry is used without a request only if it was fetched at
+        or after frozen_after, so anything cached before then gets one more
+        revalidation.
+        """
+        cached, fetched_at = self._load(url)
+        if (
+            cached is not None
+            and frozen_after is not None
+            and fetched_at is not None
+            and fetched_at >= frozen_after
+        ):
+            self._count("hits")
+            return cached
+
+        headers = {}
+        if cached is not None:
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        response = fetch(url, headers)
+        if cached is not None and response.status_code == 304:
+            self._count("revalidated")
+            self._store(url, cached, body=False)
+            return cached
+
+        self._count("misses")
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def summary(self) -> str:
+        return (
+            f"HTTP cache: {self.hits} served from disk, {self.revalidated} revalidated, "
+            f"{self.misses} downloaded"
+        )
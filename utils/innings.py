@@ -0,0 +1,49 @@
+"""Innings pitched notation, where the tenths digit counts outs (6.2 is 6 2/3 innings)"""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+def convert_ip_to_decimal(
+    ip: Union[pd.Series, np.ndarray], source: str = "IP"
+) -> Union[pd.Series, np.ndarray]:
+    """Converts IP from fractional (e.g., 1.1, 1.2) to decimal (e.g., 1.33, 1.67)
+
+    Works on whole Series/arrays. Values that aren't valid innings notation
+    (e.g. 1.3, 1.25 or negative innings) are left as they are, and a warning
+    reports how many there were. Missing values stay missing.
+    """
+    values = np.asarray(ip, dtype=float)
+    whole = np.trunc(values)
+    outs = np.round((values - whole) * 10, 6)
+
+    converted = np.where(
+        outs == 1, whole + 1 / 3, np.where(outs == 2, whole + 2 / 3, values)
+    )
+
+    malformed = np.isfinite(values) & ((values < 0) | ~np.isin(outs, (0, 1, 2)))
+    n_malformed = int(malformed.sum())
+    if n_malformed:
+        examples = ", ".join(str(v) for v in np.unique(values[malformed])[:3])
+        print(
+            f"Warning: {n_malformed} {source} values are not valid innings notation "
+            f"(e.g. {examples}); leaving them unconverted"
+        )
+
+    if isinstance(ip, pd.Series):
+        return pd.Series(converted, index=ip.index, name=ip.name)
+    return converted
+
+
+def convert_outs_to_ip(
+    outs: Union[pd.Series, np.ndarray]
+) -> Union[pd.Series, np.ndarray]:
+    """Converts a count of outs to innings notation (e.g., 20 outs is 6.2)"""
+    values = np.asarray(outs, dtype=float)
+    converted = np.trunc(values / 3) + np.mod(values, 3) / 10
+
+    if isinstance(outs, pd.Series):
+        return pd.Series(converted, index=outs.index, name=outs.name)
+    return converted
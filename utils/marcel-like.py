@@ -1,15 +1,7 @@
 import pandas as pd
 import os
 
-
-def _convert_ip_to_decimal(ip):
-    integer_part = int(ip)
-    fractional_part = round(ip - integer_part, 1)
-    if fractional_part == 0.1:
-        return integer_part + (1 / 3)
-    elif fractional_part == 0.2:
-        return integer_part + (2 / 3)
-    return ip
+from innings import convert_ip_to_decimal
 
 
 def build_batting_projections(target_year, player_bio):
@@ -154,7 +146,7 @@ def build_pitching_projections(target_year, player_bio):
         filepath = f"stats/{year}_pit.csv"
         if os.path.exists(filepath):
             df = pd.read_csv(filepath)
-            df["IP"] = df["IP"].apply(_convert_ip_to_decimal)
+            df["IP"] = convert_ip_to_decimal(df["IP"], source=filepath)
             df["year"] = year
             all_stats_dfs.append(df)
 